@@ -1,5 +1,7 @@
 import json
 import copy
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -9,6 +11,12 @@ CONFIG_PATH = Path("/data/clan_configs.json")
 # Default scaffold mirrors the new schema.
 _DEFAULT_CONFIG: Dict[int, Dict[str, Any]] = {}
 MAX_UPGRADE_LOG_ENTRIES = 250
+# Bumped on every save so callers can tell when derived views of the config are stale.
+_config_version = 0
+# Serialises file writes from the loop thread and worker threads; guards _written_version.
+_write_lock = threading.Lock()
+# Config version of the payload currently on disk, so an older snapshot never replaces a newer one.
+_written_version = -1
 
 
 def _deep_copy_config(config: Dict[int, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
@@ -281,11 +289,47 @@ def _load_server_config() -> Dict[int, Dict[str, Any]]:
     return loaded
 
 
-def save_server_config() -> None:
-    CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+def get_config_version() -> int:
+    """Return a counter that changes whenever the configuration is saved."""
+    return _config_version
+
+
+def mark_server_config_changed() -> None:
+    """Bump the config version for a change whose write to disk is deferred."""
+    global _config_version
+    _config_version += 1
+
+
+def dump_server_config() -> str:
+    """Serialise the current configuration to the JSON stored on disk."""
     serializable_config = {str(guild_id): config for guild_id, config in server_config.items()}
-    with CONFIG_PATH.open("w", encoding="utf-8") as config_file:
-        json.dump(serializable_config, config_file, indent=4)
+    return json.dumps(serializable_config, indent=4)
+
+
+def write_server_config(payload: str, version: Optional[int] = None) -> None:
+    """Write a payload produced by dump_server_config to the config file.
+
+    Writes are serialised and atomic: the payload goes to a temporary file that then
+    replaces the config. Pass the config version the payload was dumped at so a
+    snapshot that lost the race to a newer save is dropped instead of written.
+    """
+    global _written_version
+    if version is None:
+        version = _config_version
+    with _write_lock:
+        if version < _written_version:
+            return
+        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = CONFIG_PATH.with_name(CONFIG_PATH.name + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as config_file:
+            config_file.write(payload)
+        os.replace(temp_path, CONFIG_PATH)
+        _written_version = version
+
+
+def save_server_config() -> None:
+    mark_server_config_changed()
+    write_server_config(dump_server_config(), _config_version)
 
 server_config: Dict[int, Dict[str, Any]] = _load_server_config()
 # Persist defaults when the file is missing or missing keys
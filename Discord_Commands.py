@@ -1,14 +1,20 @@
 ﻿from __future__ import annotations
 
+import asyncio
 import copy
 import csv
 import re
+import time
 from datetime import datetime, timedelta, timezone
-from io import BytesIO, StringIO
-from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Tuple
+from io import BytesIO, TextIOWrapper
+from typing import Any, Callable, DefaultDict, Dict, FrozenSet, Iterable, Iterator, List, Literal, Optional, Set, Tuple
 from uuid import uuid4
 
-from collections import OrderedDict
+from collections import defaultdict
+from functools import lru_cache, wraps
+from heapq import heapify, heappop, heappush, nlargest, nsmallest
+from itertools import chain, islice, starmap
+from operator import attrgetter, itemgetter
 
 import discord
 from discord import app_commands
@@ -17,11 +23,18 @@ from discord.ext import tasks
 import coc
 
 from bot_core import bot, client
-from logger import get_logger, log_command_call, get_usage_summary
+from logger import get_logger, log_command_call, log_command_calls, get_usage_summary
 
 log = get_logger()
 from COC_API import ClanNotConfiguredError, GuildNotConfiguredError, notinWar
-from Clan_Configs import save_server_config, server_config
+from Clan_Configs import (
+    dump_server_config,
+    get_config_version,
+    mark_server_config_changed,
+    save_server_config,
+    server_config,
+    write_server_config,
+)
 from LLM_Usage import CommandHelpSession
 
 
@@ -31,12 +44,20 @@ ALERT_ROLE_NAME = "War Alerts"
 ALERT_WINDOW_SECONDS = 300
 README_URL = "https://github.com/mataeo-eh/CoC_Clan_Bot/tree/main"
 WAR_NUDGE_REASONS = ("unused_attacks", "no_attacks", "low_stars")
-DEFAULT_EVENT_DEFINITIONS: "OrderedDict[str, Dict[str, str]]" = OrderedDict(
-    [
-        ("clan_games", {"label": "Clan Games", "role_name": "Clan Games Alerts"}),
-        ("raid_weekend", {"label": "Raid Weekend", "role_name": "Raid Weekend Alerts"}),
-    ]
-)
+WAR_NUDGE_REASON_SET = frozenset(WAR_NUDGE_REASONS)
+WAR_NUDGE_LINE_FORMATTERS = {
+    "unused_attacks": lambda display, info: (
+        f"• {display} — {info.get('remaining', '?')} attack(s) remaining."
+    ),
+    "no_attacks": lambda display, info: f"• {display} — has not attacked yet.",
+    "low_stars": lambda display, info: (
+        f"• {display} — best attack {info.get('best_stars', 0)}⭐ ({info.get('used', 0)} attempt(s))."
+    ),
+}
+DEFAULT_EVENT_DEFINITIONS: Dict[str, Dict[str, str]] = {
+    "clan_games": {"label": "Clan Games", "role_name": "Clan Games Alerts"},
+    "raid_weekend": {"label": "Raid Weekend", "role_name": "Raid Weekend Alerts"},
+}
 DASHBOARD_MODULES = {
     "war_overview": "War overview",
     "donation_snapshot": "Donation snapshot",
@@ -53,6 +74,24 @@ HELP_REMINDER = (
     "Tip: After entering any command’s required options, press enter to run it. "
     "Interactive menus or buttons appear in Discord right afterward."
 )
+# Shared rejection messages for _send_error; placeholders are filled from its keyword arguments.
+ERROR_TEMPLATES: Dict[str, str] = {
+    "no_guild": "❌ This command must be used inside a Discord server.",
+    "not_admin": "❌ Only administrators can {action}.",
+    "clan_not_configured": "⚠️ `{clan_name}` is not configured for this server.",
+}
+HELP_USAGE_TEMPLATE = (
+    "📊 **Command Usage Overview**\n"
+    "Total invocations logged: {total}\n"
+    "Approximate unique users: {unique}\n"
+    "Average commands per user: {average:.2f}\n"
+    "\n"
+    "Top commands:\n"
+    "{top_section}\n"
+    "\n"
+    "Top anonymous user activity:\n"
+    "{user_section}"
+)
 
 DONATION_METRICS = ("top_donors", "low_donors", "negative_balance")
 DONATION_METRIC_INFO: Dict[str, str] = {
@@ -66,12 +105,64 @@ alert_state: Dict[Tuple[int, str, str], Set[str]] = {}
 _dirty_war_alert_state_guilds: Set[int] = set()
 _war_alert_state_loaded = False
 
+_ADMINISTRATOR_BIT = discord.Permissions(administrator=True).value
+
+# Config version at which each guild was last normalised, and the derived clan maps.
+_normalised_guild_versions: Dict[int, int] = {}
+_clan_map_cache: Dict[int, Tuple[int, Dict[str, str], Optional[str]]] = {}
+_event_search_cache: Dict[int, Tuple[int, List[Tuple[str, str, str, str]]]] = {}
+_event_match_cache: Dict[int, Tuple[int, List[str], Tuple[Dict[str, int], ...]]] = {}
+_linked_accounts_cache: Dict[Tuple[int, int], Tuple[int, List[Dict[str, Optional[str]]]]] = {}
+_account_owner_cache: Dict[int, Tuple[int, Dict[str, List[int]]]] = {}
+# Config version and number of clans with war alerts enabled across all guilds.
+_enabled_alert_clan_count: Tuple[Optional[int], int] = (None, 0)
+# Min-heap of (next_run, guild_id, position, schedule) across all guilds, rebuilt when the config changes.
+_schedule_queue: Tuple[Optional[int], List[Tuple[datetime, int, int, Dict[str, Any]]]] = (None, [])
+
+# Display-ordered text channels per guild; cleared by the channel event listeners.
+_sorted_text_channel_cache: Dict[int, List[discord.TextChannel]] = {}
+# Whether the bot may post in a channel, per guild; cleared when channels, roles, or the bot change.
+_postable_channel_cache: Dict[int, Dict[int, bool]] = {}
+# Config-derived player alias/tag lookup tables and linked (member id, first tag) pairs per guild,
+# keyed by config version. Member names are not cached; they are read live when resolving.
+_player_lookup_cache: Dict[int, Tuple[int, Dict[str, str], Dict[str, str], List[Tuple[int, str]]]] = {}
+# War alert role id per guild; verified against the live role cache on every read.
+_alert_role_ids: Dict[int, int] = {}
+# Fallback war alert channel id (or None when no channel works) per guild; cleared with the postable cache.
+_alert_channel_ids: Dict[int, Optional[int]] = {}
+
+# Command usage records waiting to be logged by the background consumer.
+USAGE_QUEUE_MAXSIZE = 10_000
+USAGE_BATCH_SIZE = 128
+# Pause after the first queued record so bursts are written as one log entry.
+USAGE_FLUSH_INTERVAL_SECONDS = 5
+_usage_queue: "asyncio.Queue[Tuple[str, Optional[int]]]" = asyncio.Queue(maxsize=USAGE_QUEUE_MAXSIZE)
+_usage_drain_task: Optional["asyncio.Task[None]"] = None
+
+# Deferred config writes: bursts of admin changes collapse into one save.
+CONFIG_SAVE_DELAY_SECONDS = 0.5
+_config_save_task: Optional["asyncio.Task[None]"] = None
+_config_save_pending = False
+
+# Short-lived war snapshots per clan tag so rapid repeat commands share one API call.
+WAR_CACHE_TTL_SECONDS = 30
+_war_cache: Dict[str, Tuple[float, Any]] = {}
+_war_locks: Dict[str, asyncio.Lock] = {}
+# Clan profiles change more slowly than war state, so they can be reused for longer.
+CLAN_CACHE_TTL_SECONDS = 60
+_clan_cache: Dict[str, Tuple[float, Any]] = {}
+_clan_locks: Dict[str, asyncio.Lock] = {}
+# Upper bound on concurrent war fetches per alert loop tick.
+WAR_ALERT_FETCH_CONCURRENCY = 16
+
 # Global dictionary to store active AI help sessions by user ID
 active_ai_help_sessions: Dict[int, "AIHelpSessionManager"] = {}
 
 
 def _record_command_usage(interaction: discord.Interaction, command_name: str) -> None:
-    """Log a command invocation with anonymised user metadata.
+    """Queue a command invocation with anonymised user metadata for background logging.
+
+    Falls back to logging inline when the queue is full so no invocation is dropped.
 
     Parameters:
         interaction (discord.Interaction): The Discord context that exposes the invoking user.
@@ -81,38 +172,148 @@ def _record_command_usage(interaction: discord.Interaction, command_name: str) -
     user_identifier = getattr(user_id, "id", None) if user_id is not None else None
     if not isinstance(user_identifier, int):
         user_identifier = None
-    log_command_call(command_name, user_id=user_identifier)
+    try:
+        _usage_queue.put_nowait((command_name, user_identifier))
+    except asyncio.QueueFull:
+        log_command_call(command_name, user_id=user_identifier)
 
 
-def _chunk_content(content: str, limit: int = MAX_MESSAGE_LENGTH) -> List[str]:
-    """Split content into manageable chunks that respect Discord's 2000-character limit."""
+async def _drain_usage_queue() -> None:
+    """Consume queued command usage records and log them in batches."""
+    while True:
+        batch = [await _usage_queue.get()]
+        await asyncio.sleep(USAGE_FLUSH_INTERVAL_SECONDS)
+        while len(batch) < USAGE_BATCH_SIZE:
+            try:
+                batch.append(_usage_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            log_command_calls(batch)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Failed to record usage for %d command invocations", len(batch))
+
+
+def ensure_usage_recorder_running() -> None:
+    """Start the background consumer that records command usage."""
+    global _usage_drain_task
+    log.debug("ensure_usage_recorder_running called")
+    if _usage_drain_task is None or _usage_drain_task.done():
+        _usage_drain_task = asyncio.get_running_loop().create_task(_drain_usage_queue())
+
+
+def _schedule_config_save() -> None:
+    """Mark the config changed now and write it to disk after a short delay.
+
+    Further calls before the write lands share the same pending save.
+    """
+    global _config_save_task, _config_save_pending
+    mark_server_config_changed()
+    _config_save_pending = True
+    if _config_save_task is None or _config_save_task.done():
+        _config_save_task = asyncio.get_running_loop().create_task(_flush_config_save())
+
+
+async def _flush_config_save() -> None:
+    """Write a pending config save once the debounce delay has passed."""
+    global _config_save_pending
+    while True:
+        await asyncio.sleep(CONFIG_SAVE_DELAY_SECONDS)
+        _config_save_pending = False
+        # Serialise on the loop so the snapshot is consistent; only the file write runs in a thread.
+        version = get_config_version()
+        payload = dump_server_config()
+        try:
+            await asyncio.to_thread(write_server_config, payload, version)
+        except OSError:
+            log.exception("Failed to write deferred server config save")
+        if not _config_save_pending:
+            return
+
+
+def flush_pending_config_save() -> None:
+    """Synchronously write any deferred config save; call during shutdown."""
+    global _config_save_pending
+    if _config_save_pending:
+        _config_save_pending = False
+        write_server_config(dump_server_config(), get_config_version())
+
+
+async def _get_cached_clan_war(tag: str) -> Any:
+    """Return the live war for a clan tag, reusing a recent fetch when available.
+
+    Concurrent callers for the same tag wait on a shared lock so only one request
+    reaches the Clash of Clans API per TTL window. Errors are not cached.
+    """
+    key = tag.upper()
+    lock = _war_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _war_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < WAR_CACHE_TTL_SECONDS:
+            log.debug("_get_cached_clan_war cache hit tag=%s", key)
+            return cached[1]
+        war = await client.get_clan_war_raw(tag)
+        _war_cache[key] = (time.monotonic(), war)
+        return war
+
+
+async def _get_cached_clan(tag: str) -> Any:
+    """Return the clan profile for a tag, reusing a recent fetch when available.
+
+    Shares the locking and error behaviour of _get_cached_clan_war.
+    """
+    key = tag.upper()
+    lock = _clan_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _clan_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < CLAN_CACHE_TTL_SECONDS:
+            log.debug("_get_cached_clan cache hit tag=%s", key)
+            return cached[1]
+        clan = await client.get_clan(tag)
+        _clan_cache[key] = (time.monotonic(), clan)
+        return clan
+
+
+def _iter_chunks(content: str, limit: int = MAX_MESSAGE_LENGTH) -> Iterator[str]:
+    """Yield chunks of content that respect Discord's 2000-character limit.
+
+    Chunks are produced lazily so callers can start sending before the whole payload is split.
+    """
     if not content:
-        return ["(no data)"]
+        yield "(no data)"
+        return
 
-    lines = content.split("\n")
-    chunks: List[str] = []
+    produced = False
     current = ""
 
-    for line in lines:
+    for line in content.split("\n"):
         if len(line) > limit:
             if current:
-                chunks.append(current)
+                yield current
+                produced = True
                 current = ""
             for i in range(0, len(line), limit):
-                chunks.append(line[i : i + limit])
+                yield line[i : i + limit]
+                produced = True
             continue
 
         if len(current) + len(line) + (1 if current else 0) > limit:
             if current:
-                chunks.append(current)
+                yield current
+                produced = True
             current = line
         else:
             current = f"{current}\n{line}" if current else line
 
     if current:
-        chunks.append(current)
+        yield current
+    elif not produced:
+        yield "(no data)"
+
 
-    return chunks or ["(no data)"]
+def _chunk_content(content: str, limit: int = MAX_MESSAGE_LENGTH) -> List[str]:
+    """Split content into manageable chunks that respect Discord's 2000-character limit."""
+    return list(_iter_chunks(content, limit))
 
 
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
@@ -126,6 +327,12 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
     """
     if not value or not isinstance(value, str):
         return None
+    return _parse_iso_string(value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_string(value: str) -> Optional[datetime]:
+    """Cached parser behind _parse_iso_timestamp; stored timestamps repeat across calls."""
     candidate = value.strip()
     if not candidate:
         return None
@@ -140,9 +347,12 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
     return parsed
 
 
+@lru_cache(maxsize=1024)
 def _format_datetime_utc(value: Optional[datetime]) -> str:
     """Format a datetime for display in UTC.
 
+    Results are memoised because usage analytics render the same timestamps repeatedly.
+
     Parameters:
         value (Optional[datetime]): Naive or timezone-aware datetime to convert for presentation.
     """
@@ -153,12 +363,26 @@ def _format_datetime_utc(value: Optional[datetime]) -> str:
     return value.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
 
-def _build_help_message(title: str, bullet_lines: Iterable[str]) -> str:
-    """Create a formatted help blurb for specialised help commands."""
+@lru_cache(maxsize=64)
+def _build_help_message(title: str, bullet_lines: Tuple[str, ...]) -> str:
+    """Create a formatted help blurb for specialised help commands.
+
+    Cached because every help command passes the same static title and bullets.
+    """
     body = "\n".join(f"• {line}" for line in bullet_lines)
     return f"**{title}**\n{body}\n\n{HELP_REMINDER}"
 
 
+async def _send_error(interaction: discord.Interaction, key: str, **fields: str) -> None:
+    """Send one of the shared ``ERROR_TEMPLATES`` messages ephemerally."""
+    template = ERROR_TEMPLATES[key]
+    await send_text_response(
+        interaction,
+        template.format_map(fields) if fields else template,
+        ephemeral=True,
+    )
+
+
 async def send_text_response(
     interaction: discord.Interaction,
     content: str,
@@ -168,53 +392,268 @@ async def send_text_response(
 ) -> None:
     """Send a text response, splitting into multiple messages when necessary."""
     log.debug("send_text_response called (ephemeral=%s, has_view=%s)", ephemeral, bool(view))
-    chunks = _chunk_content(content)
+    chunks = _iter_chunks(content)
     first_sender = (
         interaction.response.send_message
         if not interaction.response.is_done()
         else interaction.followup.send
     )
 
-    first_chunk = chunks[0]
+    first_chunk = next(chunks)
     log.debug("send_text_response sending first chunk (length=%d)", len(first_chunk))
     if view is not None:
         await first_sender(first_chunk, ephemeral=ephemeral, view=view)
     else:
         await first_sender(first_chunk, ephemeral=ephemeral)
-    for chunk in chunks[1:]:
+    for chunk in chunks:
         log.debug("send_text_response sending follow-up chunk (length=%d)", len(chunk))
         await interaction.followup.send(chunk, ephemeral=ephemeral)
 
 
+def _response_message(
+    response: discord.InteractionCallbackResponse,
+) -> Optional[discord.InteractionMessage]:
+    """Return the message created by an interaction response, if any.
+
+    Reading it from the callback avoids a follow-up ``original_response()`` fetch.
+    """
+    resource = response.resource
+    return resource if isinstance(resource, discord.InteractionMessage) else None
+
+
+async def _defer_ephemeral(interaction: discord.Interaction, command_name: str) -> None:
+    """Acknowledge an interaction straight away so slow setup cannot miss Discord's 3s window."""
+    if interaction.response.is_done():
+        return
+    try:
+        await interaction.response.defer(ephemeral=True, thinking=True)
+    except discord.HTTPException as exc:
+        log.warning("Failed to defer interaction for %s: %s", command_name, exc)
+
+
+async def _send_view_message(
+    interaction: discord.Interaction,
+    content: str,
+    view: discord.ui.View,
+) -> Optional[discord.Message]:
+    """Send an ephemeral view and return its message, whether or not the interaction was deferred."""
+    if interaction.response.is_done():
+        return await interaction.followup.send(content, ephemeral=True, view=view, wait=True)
+    response = await interaction.response.send_message(content, ephemeral=True, view=view)
+    return _response_message(response)
+
+
+def _as_member(user: Any) -> Optional[discord.Member]:
+    """Return ``user`` when it is a guild member, otherwise None."""
+    if type(user) is discord.Member or isinstance(user, discord.Member):
+        return user
+    return None
+
+
+def _as_text_channel(channel: Any) -> Optional[discord.TextChannel]:
+    """Return ``channel`` when it is a guild text channel, otherwise None."""
+    if type(channel) is discord.TextChannel or isinstance(channel, discord.TextChannel):
+        return channel
+    return None
+
+
+def _is_admin(member: Any) -> bool:
+    """Return True when ``member`` is a guild member holding the Administrator permission.
+
+    Matches ``Member.guild_permissions.administrator`` but stops at the first role
+    granting it instead of folding every role's permissions.
+    """
+    member = _as_member(member)
+    if member is None:
+        return False
+    if member.guild.owner_id == member.id:
+        return True
+    return any(role.permissions.value & _ADMINISTRATOR_BIT for role in member.roles)
+
+
+def _resolve_member(interaction: discord.Interaction) -> Optional[discord.Member]:
+    """Return the invoking guild member, falling back to the member cache for bare users."""
+    member = _as_member(interaction.user)
+    if member is None and interaction.guild is not None:
+        member = interaction.guild.get_member(interaction.user.id)
+    return member
+
+
+def require_guild_admin(command_name: str, action: str):
+    """Decorate a slash command so it records usage and only runs for guild administrators.
+
+    Parameters:
+        command_name (str): Name recorded in the usage telemetry.
+        action (str): Completes the rejection message "Only administrators can ...".
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+            _record_command_usage(interaction, command_name)
+            if interaction.guild is None:
+                await _send_error(interaction, "no_guild")
+                return None
+            if not _is_admin(interaction.user):
+                await _send_error(interaction, "not_admin", action=action)
+                return None
+            return await func(interaction, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def _timestamp_to_datetime(ts: Optional[coc.Timestamp]) -> Optional[datetime]:
     """Convert a CoC timestamp wrapper into a timezone-aware datetime."""
     log.debug("_timestamp_to_datetime invoked")
     if ts is None:
         return None
-    if hasattr(ts, "time"):
-        return ts.time
-    if isinstance(ts, datetime):
-        return ts
-    return None
+    value = getattr(ts, "time", ts)
+    if not isinstance(value, datetime):
+        return None
+    # coc timestamps are naive UTC; attach the zone here so callers never see a naive value.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _text_channel_sort_key(channel: discord.TextChannel) -> Tuple[int, int, int]:
+    """Order text channels the way Discord displays them (category, position, id)."""
+    category_position = channel.category.position if channel.category else -1
+    return (category_position, channel.position, channel.id)
+
+
+def _sorted_text_channels(guild: discord.Guild) -> List[discord.TextChannel]:
+    """Return the guild's text channels in display order, reusing a cached sort."""
+    cached = _sorted_text_channel_cache.get(guild.id)
+    if cached is None:
+        cached = sorted(guild.text_channels, key=_text_channel_sort_key)
+        _sorted_text_channel_cache[guild.id] = cached
+    return cached
+
+
+def _forget_postable_channels(guild_id: int) -> None:
+    """Drop cached posting permissions, and the alert channel chosen from them, for a guild."""
+    _postable_channel_cache.pop(guild_id, None)
+    _alert_channel_ids.pop(guild_id, None)
+
+
+def _invalidate_channel_cache(guild_id: int) -> None:
+    """Drop cached channel ordering after the guild's channel layout changes."""
+    _sorted_text_channel_cache.pop(guild_id, None)
+    _forget_postable_channels(guild_id)
+
+
+def _bot_can_post(channel: Any) -> bool:
+    """Return True when the bot can send messages in ``channel``, reusing cached answers."""
+    guild = channel.guild
+    guild_cache = _postable_channel_cache.setdefault(guild.id, {})
+    allowed = guild_cache.get(channel.id)
+    if allowed is None:
+        me = guild.me
+        allowed = me is not None and channel.permissions_for(me).send_messages
+        guild_cache[channel.id] = allowed
+    return allowed
+
+
+@bot.listen("on_guild_channel_create")
+async def _on_guild_channel_create(channel: discord.abc.GuildChannel) -> None:
+    _invalidate_channel_cache(channel.guild.id)
+
+
+@bot.listen("on_guild_channel_delete")
+async def _on_guild_channel_delete(channel: discord.abc.GuildChannel) -> None:
+    _invalidate_channel_cache(channel.guild.id)
+
+
+@bot.listen("on_guild_channel_update")
+async def _on_guild_channel_update(
+    before: discord.abc.GuildChannel,
+    after: discord.abc.GuildChannel,
+) -> None:
+    _invalidate_channel_cache(after.guild.id)
+
+
+@bot.listen("on_guild_update")
+async def _on_guild_update(before: discord.Guild, after: discord.Guild) -> None:
+    # The system channel is the preferred alert channel.
+    _alert_channel_ids.pop(after.id, None)
+
+
+@bot.listen("on_guild_role_update")
+async def _on_guild_role_update(before: discord.Role, after: discord.Role) -> None:
+    _forget_postable_channels(after.guild.id)
+
+
+@bot.listen("on_guild_role_delete")
+async def _on_guild_role_delete(role: discord.Role) -> None:
+    _forget_postable_channels(role.guild.id)
+
+
+@bot.listen("on_member_update")
+async def _on_member_update(before: discord.Member, after: discord.Member) -> None:
+    if bot.user is not None and after.id == bot.user.id:
+        _forget_postable_channels(after.guild.id)
+
+
+def _get_alert_role(guild: discord.Guild) -> Optional[discord.Role]:
+    """Return the guild's war alert role, scanning roles by name only on a cache miss."""
+    role_id = _alert_role_ids.get(guild.id)
+    role = guild.get_role(role_id) if role_id is not None else None
+    if role is not None and role.name == ALERT_ROLE_NAME:
+        return role
+    role = discord.utils.get(guild.roles, name=ALERT_ROLE_NAME)
+    if role is not None:
+        _alert_role_ids[guild.id] = role.id
+    else:
+        _alert_role_ids.pop(guild.id, None)
+    return role
 
 
 def _find_alert_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
-    """Select a text channel where the bot can post war alerts."""
+    """Select a text channel where the bot can post war alerts.
+
+    The choice is remembered until channels, roles, or the bot's permissions change.
+    """
     log.debug("_find_alert_channel invoked")
-    if guild.system_channel and guild.system_channel.permissions_for(guild.me).send_messages:
-        return guild.system_channel
-    for channel in guild.text_channels:
-        if channel.permissions_for(guild.me).send_messages:
+    if guild.id in _alert_channel_ids:
+        channel_id = _alert_channel_ids[guild.id]
+        if channel_id is None:
+            return None
+        channel = guild.get_channel(channel_id)
+        if isinstance(channel, discord.TextChannel):
             return channel
-    return None
+    found: Optional[discord.TextChannel]
+    if guild.system_channel and _bot_can_post(guild.system_channel):
+        found = guild.system_channel
+    else:
+        found = next((channel for channel in guild.text_channels if _bot_can_post(channel)), None)
+    _alert_channel_ids[guild.id] = found.id if found is not None else None
+    return found
+
 
+async def send_channel_message(
+    channel: discord.TextChannel,
+    content: str,
+    *,
+    file: Optional[discord.File] = None,
+) -> None:
+    """Post text content to a channel, splitting when Discord's limit is exceeded.
 
-async def send_channel_message(channel: discord.TextChannel, content: str) -> None:
-    """Post text content to a channel, splitting when Discord's limit is exceeded."""
+    An optional file rides along with the final chunk instead of costing a separate message.
+    """
     log.debug("send_channel_message called")
-    for chunk in _chunk_content(content):
-        log.debug("send_channel_message chunk length=%d", len(chunk))
-        await channel.send(chunk)
+    # Chunks must stay in order, so they are sent one at a time.
+    chunks = _iter_chunks(content)
+    last_chunk = next(chunks)
+    for chunk in chunks:
+        log.debug("send_channel_message chunk length=%d", len(last_chunk))
+        await channel.send(last_chunk)
+        last_chunk = chunk
+    log.debug("send_channel_message chunk length=%d", len(last_chunk))
+    if file is None:
+        await channel.send(last_chunk)
+    else:
+        await channel.send(last_chunk, file=file)
 
 
 def _alert_key(guild_id: int, clan_name: str, war_tag: str) -> Tuple[int, str, str]:
@@ -389,27 +828,23 @@ def _register_alias(lookup: Dict[str, str], alias: str, tag: str) -> None:
         lookup.setdefault(key, tag)
 
 
-def _build_player_lookup(guild: discord.Guild) -> Tuple[Dict[str, str], Dict[str, str]]:
-    """Create lookup tables for resolving player references to tags."""
-    guild_config = _ensure_guild_config(guild.id)
+def _build_player_lookup(
+    guild_id: int,
+) -> Tuple[Dict[str, str], Dict[str, str], List[Tuple[int, str]]]:
+    """Create the config-derived lookup tables for resolving player references to tags.
+
+    Also returns (member id, first linked tag) pairs so member names can be matched live.
+    """
+    guild_config = _ensure_guild_config(guild_id)
     alias_map: Dict[str, str] = {}
     tag_map: Dict[str, str] = {}
+    linked_members: List[Tuple[int, str]] = []
 
     # Linked accounts stored per Discord member.
     player_accounts = guild_config.get("player_accounts", {})
     for user_id_str, records in player_accounts.items():
         if not isinstance(records, list):
             continue
-        member: Optional[discord.Member] = None
-        if user_id_str.isdigit():
-            member = guild.get_member(int(user_id_str))
-        name_candidates = {
-            getattr(member, "display_name", None),
-            getattr(member, "name", None),
-            getattr(member, "global_name", None),
-            getattr(member, "nick", None),
-        } if member else set()
-        name_candidates.discard(None)
 
         first_tag: Optional[str] = None
         for record in records:
@@ -427,21 +862,12 @@ def _build_player_lookup(guild: discord.Guild) -> Tuple[Dict[str, str], Dict[str
             if isinstance(alias_value, str) and alias_value.strip():
                 _register_alias(alias_map, alias_value, normalised_tag)
 
-            for name in name_candidates:
-                if isinstance(name, str) and name.strip():
-                    _register_alias(alias_map, name, normalised_tag)
-                    _register_alias(alias_map, f"@{name}", normalised_tag)
-
         if first_tag:
             _register_alias(alias_map, user_id_str, first_tag)
-            if member is not None:
-                mention_variants = (
-                    f"<@{member.id}>",
-                    f"<@!{member.id}>",
-                    str(member.id),
-                )
-                for variant in mention_variants:
+            if user_id_str.isdigit():
+                for variant in (f"<@{user_id_str}>", f"<@!{user_id_str}>"):
                     _register_alias(alias_map, variant, first_tag)
+                linked_members.append((int(user_id_str), first_tag))
 
     # Legacy global mappings.
     for alias, tag in guild_config.get("player_tags", {}).items():
@@ -452,7 +878,28 @@ def _build_player_lookup(guild: discord.Guild) -> Tuple[Dict[str, str], Dict[str
         _register_alias(alias_map, alias, normalised_tag)
         _register_alias(alias_map, normalised_tag, normalised_tag)
 
-    return alias_map, tag_map
+    return alias_map, tag_map, linked_members
+
+
+def _match_member_name(
+    guild: discord.Guild,
+    linked_members: List[Tuple[int, str]],
+    candidate: str,
+) -> Optional[str]:
+    """Return the first linked tag whose member's current name matches ``candidate``."""
+    candidate_keys = _alias_key_variants(candidate)
+    for member_id, tag in linked_members:
+        member = guild.get_member(member_id)
+        if member is None:
+            continue
+        for name in {member.display_name, member.name, member.global_name, member.nick}:
+            if not isinstance(name, str) or not name.strip():
+                continue
+            if not candidate_keys.isdisjoint(_alias_key_variants(name)) or not candidate_keys.isdisjoint(
+                _alias_key_variants(f"@{name}")
+            ):
+                return tag
+    return None
 
 
 def _resolve_player_reference(guild: discord.Guild, reference: str) -> Optional[str]:
@@ -469,7 +916,11 @@ def _resolve_player_reference(guild: discord.Guild, reference: str) -> Optional[
         if direct_tag:
             return direct_tag
 
-    alias_map, tag_map = _build_player_lookup(guild)
+    version = get_config_version()
+    cached = _player_lookup_cache.get(guild.id)
+    if cached is None or cached[0] != version:
+        cached = _player_lookup_cache[guild.id] = (version, *_build_player_lookup(guild.id))
+    _, alias_map, tag_map, linked_members = cached
 
     # Mentions such as <@123> or <@!123>.
     if candidate.startswith("<@") and candidate.endswith(">"):
@@ -490,6 +941,11 @@ def _resolve_player_reference(guild: discord.Guild, reference: str) -> Optional[
         if resolved:
             return resolved
 
+    # Member names change without reliable events, so they are matched against the live cache.
+    resolved = _match_member_name(guild, linked_members, candidate)
+    if resolved:
+        return resolved
+
     # Final fallback: treat as tag without a leading hash.
     fallback_tag = _normalise_player_tag(candidate)
     if fallback_tag and fallback_tag in tag_map:
@@ -498,22 +954,41 @@ def _resolve_player_reference(guild: discord.Guild, reference: str) -> Optional[
     return None
 
 
+def _linked_accounts_for_member(guild_id: int, member_id: int) -> List[Dict[str, Optional[str]]]:
+    """Return a member's linked accounts as normalised ``{"tag", "alias"}`` records.
+
+    Results are reused until the stored configuration changes.
+    """
+    guild_config = _ensure_guild_config(guild_id)
+    version = get_config_version()
+    cache_key = (guild_id, member_id)
+    cached = _linked_accounts_cache.get(cache_key)
+    if cached is None or cached[0] != version:
+        raw_accounts = guild_config.get("player_accounts", {}).get(str(member_id), [])
+        linked_accounts: List[Dict[str, Optional[str]]] = []
+        for record in raw_accounts:
+            if not isinstance(record, dict):
+                continue
+            tag = _normalise_player_tag(record.get("tag"))
+            if tag is None:
+                continue
+            alias_value = record.get("alias")
+            linked_accounts.append(
+                {
+                    "tag": tag,
+                    "alias": alias_value.strip() if isinstance(alias_value, str) and alias_value.strip() else None,
+                }
+            )
+        cached = _linked_accounts_cache[cache_key] = (version, linked_accounts)
+    return list(cached[1])
+
+
 def _summarise_linked_accounts(guild: discord.Guild, member_id: int) -> str:
     """Return a human-readable summary of linked accounts for a guild member."""
-    guild_config = _ensure_guild_config(guild.id)
-    accounts = guild_config.get("player_accounts", {}).get(str(member_id), [])
-    summaries: List[str] = []
-    for record in accounts:
-        if not isinstance(record, dict):
-            continue
-        tag = _normalise_player_tag(record.get("tag"))
-        if tag is None:
-            continue
-        alias = record.get("alias")
-        if isinstance(alias, str) and alias.strip():
-            summaries.append(f"{alias.strip()} ({tag})")
-        else:
-            summaries.append(tag)
+    summaries = [
+        f"{account['alias']} ({account['tag']})" if account["alias"] else account["tag"]
+        for account in _linked_accounts_for_member(guild.id, member_id)
+    ]
     return ", ".join(summaries) if summaries else "None linked yet"
 
 
@@ -602,7 +1077,7 @@ async def _link_player_account(
     if normalised_tag is None:
         raise PlayerLinkError("⚠️ Please provide a valid player tag like `#ABC123`.")
 
-    if target != actor and not actor.guild_permissions.administrator:
+    if target != actor and not _is_admin(actor):
         raise PlayerLinkError("❌ Only administrators can manage linked tags for other members.")
 
     guild_config = _ensure_guild_config(guild.id)
@@ -690,14 +1165,10 @@ async def set_clan(
     log.debug("set_clan invoked clan=%s", clan_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command can only be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
+    if not _is_admin(interaction.user):
         await send_text_response(
             interaction,
             "You need the Administrator permission to configure this command.",
@@ -714,15 +1185,7 @@ async def set_clan(
         actor=interaction.user,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture set_clan view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 # ---------------------------------------------------------------------------
@@ -753,11 +1216,11 @@ async def help_war_info(interaction: discord.Interaction) -> None:
     """Describe the workflow for the interactive war information command."""
     _record_command_usage(interaction, "help_war_info")
     log.debug("help_war_info invoked")
-    bullets = [
+    bullets = (
         "Run `/clan_war_info_menu` and pick a configured clan name.",
         "Use the dropdown to choose which sections (members, status, timers) you want to see.",
         "Press **Broadcast** to share the latest selection with the channel or **Private Copy** to keep it for yourself.",
-    ]
+    )
     await send_text_response(
         interaction,
         _build_help_message("War Info Helper", bullets),
@@ -772,12 +1235,12 @@ async def help_assign_bases(interaction: discord.Interaction) -> None:
     """Outline how to share assignments with `/assign_bases`."""
     _record_command_usage(interaction, "help_assign_bases")
     log.debug("help_assign_bases invoked")
-    bullets = [
+    bullets = (
         "Call `/assign_bases` and pick the clan you want to coordinate.",
         "Use **Per Player Assignments** to select a home base, enter one or two enemy targets, and repeat as needed.",
         "Choose **Post Assignments** when finished—the bot formats the summary and pings the alert role automatically.",
         "Use **General Assignment Rule** for broad reminders (for example, mirrors-only or cleanup hour).",
-    ]
+    )
     await send_text_response(
         interaction,
         _build_help_message("Assign Bases Helper", bullets),
@@ -792,12 +1255,12 @@ async def help_plan_upgrade(interaction: discord.Interaction) -> None:
     """Explain how members can submit upgrade plans."""
     _record_command_usage(interaction, "help_plan_upgrade")
     log.debug("help_plan_upgrade invoked")
-    bullets = [
+    bullets = (
         "Link each Clash account to your Discord profile with `/link_player`.",
         "Run `/plan_upgrade`, pick your linked account, and use **Enter Upgrade Details** to supply the building, levels, and duration.",
         "Review the draft summary, add optional notes or clan association, then press **Submit Upgrade** to post in the configured channel.",
         "Admins set or change the destination channel with `/set_upgrade_channel`.",
-    ]
+    )
     await send_text_response(
         interaction,
         _build_help_message("Upgrade Planner Helper", bullets),
@@ -812,11 +1275,11 @@ async def help_dashboard(interaction: discord.Interaction) -> None:
     """Describe the dashboard configuration and posting commands."""
     _record_command_usage(interaction, "help_dashboard")
     log.debug("help_dashboard invoked")
-    bullets = [
+    bullets = (
         "Admins run `/configure_dashboard` to pick modules (war overview, donations, upgrades, event opt-ins) and a default channel.",
         "Anyone can call `/dashboard` for a configured clan; override modules or format with the optional fields when needed.",
         "Select `embed`, `csv`, or `both` to choose between an embed preview and a downloadable CSV snapshot.",
-    ]
+    )
     await send_text_response(
         interaction,
         _build_help_message("Dashboard Helper", bullets),
@@ -832,12 +1295,12 @@ async def help_schedule_report(interaction: discord.Interaction) -> None:
     """Summarise the scheduled report command family."""
     _record_command_usage(interaction, "help_schedule_report")
     log.debug("help_schedule_report invoked")
-    bullets = [
+    bullets = (
         "Run `/schedule_report` to open the interactive editor, pick the clan, report type, cadence, and time, then press **Save**.",
         "Use the on-screen buttons to adjust dashboard modules/format or toggle season summary sections as needed.",
         "Run `/list_schedules` to review upcoming jobs and `/cancel_schedule` with an ID to remove an entry.",
         "The scheduler posts automatically as soon as the next run time arrives.",
-    ]
+    )
     await send_text_response(
         interaction,
         _build_help_message("Scheduled Reports Helper", bullets),
@@ -849,68 +1312,42 @@ async def help_schedule_report(interaction: discord.Interaction) -> None:
 # Slash command: /help_usage
 # ---------------------------------------------------------------------------
 @bot.tree.command(name="help_usage", description="Show aggregate command usage analytics (admin only).")
+@require_guild_admin("help_usage", "view usage analytics")
 async def help_usage(interaction: discord.Interaction):
     """Display anonymised command analytics for administrators.
 
     Parameters:
         interaction (discord.Interaction): Invocation context; must originate from a server administrator.
     """
-    _record_command_usage(interaction, "help_usage")
     log.debug("help_usage invoked")
 
-    if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
-        return
-
-    member = interaction.user
-    if not isinstance(member, discord.Member) or not member.guild_permissions.administrator:
-        await send_text_response(
-            interaction,
-            "❌ Only administrators can view usage analytics.",
-            ephemeral=True,
-        )
-        return
-
     summary = get_usage_summary()
-    lines = [
-        "📊 **Command Usage Overview**",
-        f"Total invocations logged: {summary.get('total_invocations', 0)}",
-        f"Approximate unique users: {summary.get('unique_users', 0)}",
-        f"Average commands per user: {summary.get('average_per_user', 0.0):.2f}",
-        "",
-        "Top commands:",
-    ]
-
+    total = summary.get("total_invocations", 0)
+    unique = summary.get("unique_users", 0)
+    average = summary.get("average_per_user", 0.0)
     top_commands = summary.get("top_commands", [])
-    if top_commands:
-        for index, entry in enumerate(top_commands, start=1):
-            lines.append(
-                f"{index}. {entry.get('name')} — {entry.get('count', 0)} call(s) "
-                f"(last used { _format_datetime_utc(entry.get('last_invoked')) })"
-            )
-    else:
-        lines.append("No commands have been recorded yet.")
-
     top_counts = summary.get("top_user_counts", [])
-    lines.extend(
-        [
-            "",
-            "Top anonymous user activity:",
-        ]
-    )
-    if top_counts:
-        for index, count in enumerate(top_counts, start=1):
-            lines.append(f"User #{index}: {count} call(s)")
-    else:
-        lines.append("No user activity recorded yet.")
 
+    top_section = "\n".join(
+        f"{index}. {entry['name']} — {entry['count']} call(s) "
+        f"(last used {_format_datetime_utc(entry['last_invoked'])})"
+        for index, entry in enumerate(top_commands, start=1)
+    ) or "No commands have been recorded yet."
+    user_section = "\n".join(
+        f"User #{index}: {count} call(s)"
+        for index, count in enumerate(top_counts, start=1)
+    ) or "No user activity recorded yet."
+
+    content = HELP_USAGE_TEMPLATE.format(
+        total=total,
+        unique=unique,
+        average=average,
+        top_section=top_section,
+        user_section=user_section,
+    )
     await send_text_response(
         interaction,
-        "\n".join(lines),
+        content,
         ephemeral=True,
     )
 
@@ -1204,19 +1641,11 @@ async def help_from_ai_end_session(interaction: discord.Interaction):
     description="Select the text channel where war alerts will be posted for a clan.",
 )
 @app_commands.describe(clan_name="Choose a configured clan to update.")
+@require_guild_admin("choose_war_alert_channel", "configure alert destinations")
 async def choose_war_alert_channel(interaction: discord.Interaction, clan_name: str):
     """Allow administrators to pick the destination channel for war alerts."""
-    _record_command_usage(interaction, "choose_war_alert_channel")
     log.debug("choose_war_alert_channel invoked for %s", clan_name)
 
-    if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command can only be used inside a Discord server.",
-            ephemeral=True,
-        )
-        return
-
     if not interaction.response.is_done():
         try:
             await interaction.response.defer(ephemeral=True, thinking=False)
@@ -1224,23 +1653,12 @@ async def choose_war_alert_channel(interaction: discord.Interaction, clan_name:
             log.warning("Failed to defer interaction for choose_war_alert_channel: %s", exc)
 
     member = interaction.user
-    if not isinstance(member, discord.Member) or not member.guild_permissions.administrator:
-        await send_text_response(
-            interaction,
-            "❌ Only administrators can configure alert destinations.",
-            ephemeral=True,
-        )
-        return
 
     guild = interaction.guild
     guild_config = _ensure_guild_config(guild.id)
     clan_entry = guild_config["clans"].get(clan_name)
     if not isinstance(clan_entry, dict):
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured for this server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
 
     bot_member = guild.me
@@ -1253,22 +1671,13 @@ async def choose_war_alert_channel(interaction: discord.Interaction, clan_name:
         return
 
     # Build category -> channel mapping only including channels both the bot and caller can use.
-    channels_by_category: Dict[Optional[int], List[discord.TextChannel]] = {}
-    def sort_key(ch: discord.TextChannel) -> Tuple[int, int, int]:
-        category_position = ch.category.position if ch.category else -1
-        return (category_position, ch.position, ch.id)
-
-    for channel in sorted(guild.text_channels, key=sort_key):
+    channels_by_category: DefaultDict[Optional[int], List[discord.TextChannel]] = defaultdict(list)
+    for channel in _sorted_text_channels(guild):
         if not channel.permissions_for(bot_member).send_messages:
             continue
         if not channel.permissions_for(member).view_channel:
             continue
-        category_id = channel.category_id
-        channels_by_category.setdefault(category_id, []).append(channel)
-
-    channels_by_category = {
-        key: value for key, value in channels_by_category.items() if value
-    }
+        channels_by_category[channel.category_id].append(channel)
 
     if not channels_by_category:
         await send_text_response(
@@ -1316,30 +1725,14 @@ async def choose_war_alert_channel(interaction: discord.Interaction, clan_name:
 @app_commands.describe(
     clan_name="Optional clan to preselect for configuration.",
 )
+@require_guild_admin("configure_war_nudge", "configure war nudges")
 async def configure_war_nudge(
     interaction: discord.Interaction,
     clan_name: Optional[str] = None,
 ):
     """Maintain the list of war nudge reasons stored per clan."""
-    _record_command_usage(interaction, "configure_war_nudge")
     log.debug("configure_war_nudge invoked clan=%s", clan_name)
 
-    if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
-        return
-
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
-        await send_text_response(
-            interaction,
-            "⚠️ Only administrators can configure war nudges.",
-            ephemeral=True,
-        )
-        return
-
     clan_map = _clan_names_for_guild(interaction.guild.id)
     if not clan_map:
         await send_text_response(
@@ -1349,18 +1742,10 @@ async def configure_war_nudge(
         )
         return
 
-    default_clan = clan_name if clan_name in clan_map else next(iter(clan_map))
+    default_clan = clan_name if clan_name in clan_map else _default_clan_for_guild(interaction.guild.id)
     view = WarNudgeConfigView(interaction.guild, default_clan)
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Unable to capture configure_war_nudge message handle: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 # ---------------------------------------------------------------------------
@@ -1377,20 +1762,12 @@ async def war_nudge(interaction: discord.Interaction, clan_name: str, reason_nam
     log.debug("war_nudge invoked for clan=%s reason=%s", clan_name, reason_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     clan_entry = _get_clan_entry(interaction.guild.id, clan_name)
     if clan_entry is None:
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured for this server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
 
     reasons = clan_entry.get("war_nudge", {}).get("reasons", [])
@@ -1422,7 +1799,7 @@ async def war_nudge(interaction: discord.Interaction, clan_name: str, reason_nam
         return
 
     try:
-        war = await client.get_clan_war_raw(tag)
+        war = await _get_cached_clan_war(tag)
     except coc.errors.PrivateWarLog:
         await send_text_response(
             interaction,
@@ -1446,7 +1823,7 @@ async def war_nudge(interaction: discord.Interaction, clan_name: str, reason_nam
         return
 
     reason_type = selected_reason.get("type")
-    if reason_type not in WAR_NUDGE_REASONS:
+    if reason_type not in WAR_NUDGE_REASON_SET:
         await send_text_response(
             interaction,
             "⚠️ This reason was saved with an unsupported type. Please reconfigure it.",
@@ -1463,24 +1840,13 @@ async def war_nudge(interaction: discord.Interaction, clan_name: str, reason_nam
         )
         return
 
+    format_line = WAR_NUDGE_LINE_FORMATTERS[reason_type]
     lines = []
     for member, info in targets:
         tag = getattr(member, "tag", None)
         discord_member = _lookup_member_by_tag(interaction.guild, tag) if tag else None
-        name = getattr(member, "name", "Unknown")
-        display = discord_member.mention if discord_member else name
-        if reason_type == "unused_attacks":
-            lines.append(
-                f"• {display} — {info.get('remaining', '?')} attack(s) remaining."
-            )
-        elif reason_type == "no_attacks":
-            lines.append(
-                f"• {display} — has not attacked yet."
-            )
-        elif reason_type == "low_stars":
-            lines.append(
-                f"• {display} — best attack {info.get('best_stars', 0)}⭐ ({info.get('used', 0)} attempt(s))."
-            )
+        display = discord_member.mention if discord_member else getattr(member, "name", "Unknown")
+        lines.append(format_line(display, info))
 
     mention_prefix = _build_reason_mention(interaction.guild, selected_reason)
     description = selected_reason.get("description") or ""
@@ -1509,37 +1875,18 @@ async def war_nudge(interaction: discord.Interaction, clan_name: str, reason_nam
     clan_name="Configured clan to update.",
     channel="Optional default channel for dashboard posts.",
 )
+@require_guild_admin("configure_dashboard", "configure dashboards")
 async def configure_dashboard(
     interaction: discord.Interaction,
     clan_name: str,
     channel: Optional[discord.TextChannel] = None,
 ):
     """Provide an interactive selector for dashboard modules and format."""
-    _record_command_usage(interaction, "configure_dashboard")
     log.debug("configure_dashboard invoked clan=%s channel=%s", clan_name, getattr(channel, "id", None))
 
-    if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
-        return
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
-        await send_text_response(
-            interaction,
-            "❌ Only administrators can configure dashboards.",
-            ephemeral=True,
-        )
-        return
-
     clan_entry = _get_clan_entry(interaction.guild.id, clan_name)
     if clan_entry is None:
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
 
     modules, fmt, default_channel_id = _dashboard_defaults(clan_entry)
@@ -1578,11 +1925,7 @@ async def dashboard(
     log.debug("dashboard invoked clan=%s", clan_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     clan_map = _clan_names_for_guild(interaction.guild.id)
@@ -1594,7 +1937,7 @@ async def dashboard(
         )
         return
 
-    selected_clan = clan_name if isinstance(clan_name, str) and clan_name in clan_map else next(iter(clan_map))
+    selected_clan = clan_name if isinstance(clan_name, str) and clan_name in clan_map else _default_clan_for_guild(interaction.guild.id)
     clan_entry = _get_clan_entry(interaction.guild.id, selected_clan)
     if clan_entry is None:
         await send_text_response(
@@ -1607,11 +1950,9 @@ async def dashboard(
     modules, fmt, default_channel_id = _dashboard_defaults(clan_entry)
     default_channel = None
     if isinstance(default_channel_id, int):
-        candidate = interaction.guild.get_channel(default_channel_id)
-        if isinstance(candidate, discord.TextChannel):
-            default_channel = candidate
+        default_channel = _as_text_channel(interaction.guild.get_channel(default_channel_id))
 
-    fallback_channel = interaction.channel if isinstance(interaction.channel, discord.TextChannel) else None
+    fallback_channel = _as_text_channel(interaction.channel)
     initial_channel = default_channel or fallback_channel
 
     view = DashboardRunView(
@@ -1624,15 +1965,7 @@ async def dashboard(
         fallback_channel=fallback_channel,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture dashboard view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 # ---------------------------------------------------------------------------
@@ -1665,18 +1998,10 @@ async def link_player(
     )
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "⚠️ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    actor = (
-        interaction.user
-        if isinstance(interaction.user, discord.Member)
-        else interaction.guild.get_member(interaction.user.id)
-    )
+    actor = _resolve_member(interaction)
     if actor is None:
         await send_text_response(
             interaction,
@@ -1691,7 +2016,7 @@ async def link_player(
 
     target: discord.Member = actor
     if isinstance(target_member, discord.Member) and target_member.id != actor.id:
-        if actor.guild_permissions.administrator:
+        if _is_admin(actor):
             target = target_member
         else:
             await send_text_response(
@@ -1710,15 +2035,7 @@ async def link_player(
         initial_target=target,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture link_player view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 
@@ -1730,31 +2047,15 @@ async def link_player(
     clan_name="Optional clan to preselect when opening the editor.",
     plan_name="Optional plan to preselect when the editor opens.",
 )
+@require_guild_admin("save_war_plan", "save war plans")
 async def save_war_plan(
     interaction: discord.Interaction,
     clan_name: Optional[str] = None,
     plan_name: Optional[str] = None,
 ):
     """Launch an interactive editor for creating or updating war plans."""
-    _record_command_usage(interaction, "save_war_plan")
     log.debug("save_war_plan invoked clan=%s plan=%s", clan_name, plan_name)
 
-    if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
-        return
-
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
-        await send_text_response(
-            interaction,
-            "Only administrators can save war plans.",
-            ephemeral=True,
-        )
-        return
-
     clan_map = _clan_names_for_guild(interaction.guild.id)
     if not clan_map:
         await send_text_response(
@@ -1768,7 +2069,7 @@ async def save_war_plan(
     if isinstance(clan_name, str) and clan_name in clan_map:
         selected_clan = clan_name
     else:
-        selected_clan = next(iter(clan_map))
+        selected_clan = _default_clan_for_guild(interaction.guild.id)
 
     if isinstance(plan_name, str):
         plan_name = plan_name.strip() or None
@@ -1781,15 +2082,7 @@ async def save_war_plan(
         actor=interaction.user,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture save_war_plan view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 # ---------------------------------------------------------------------------
@@ -1803,20 +2096,12 @@ async def list_war_plans(interaction: discord.Interaction, clan_name: str):
     log.debug("list_war_plans invoked clan=%s", clan_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     clan_entry = _get_clan_entry(interaction.guild.id, clan_name)
     if clan_entry is None:
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
 
     war_plans = clan_entry.get("war_plans", {})
@@ -1828,13 +2113,13 @@ async def list_war_plans(interaction: discord.Interaction, clan_name: str):
         )
         return
 
-    lines = [
-        f"• **{name}** (last updated {plan.get('updated_at', 'unknown')})"
-        for name, plan in war_plans.items()
-    ]
+    header = f"War plans for `{clan_name}`:\n"
     await send_text_response(
         interaction,
-        f"War plans for `{clan_name}`:\n" + "\n".join(lines),
+        header + "\n".join(
+            f"• **{name}** (last updated {plan['updated_at'] or 'unknown'})"
+            for name, plan in war_plans.items()
+        ),
         ephemeral=True,
     )
 
@@ -1859,11 +2144,7 @@ async def war_plan(
     log.debug("war_plan invoked clan=%s plan=%s", clan_name, plan_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     if isinstance(plan_name, str):
@@ -1881,10 +2162,10 @@ async def war_plan(
     if isinstance(clan_name, str) and clan_name in clan_map:
         selected_clan = clan_name
     else:
-        selected_clan = next(iter(clan_map))
+        selected_clan = _default_clan_for_guild(interaction.guild.id)
 
-    explicit_channel = target_channel if isinstance(target_channel, discord.TextChannel) else None
-    fallback_channel = interaction.channel if isinstance(interaction.channel, discord.TextChannel) else None
+    explicit_channel = _as_text_channel(target_channel)
+    fallback_channel = _as_text_channel(interaction.channel)
 
     view = WarPlanPostView(
         guild=interaction.guild,
@@ -1895,15 +2176,7 @@ async def war_plan(
         fallback_channel=fallback_channel,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture war_plan view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 # ---------------------------------------------------------------------------
@@ -1953,9 +2226,15 @@ async def player_info(interaction: discord.Interaction, player_reference: str):
 
     log.debug("player_info resolved %s -> %s", reference, resolved_tag)
 
-    await interaction.response.defer(ephemeral=True, thinking=True)
+    # Start the API fetch first so it overlaps the defer round-trip to Discord.
+    player_task = asyncio.create_task(client.get_player(resolved_tag))
     try:
-        player_info = await client.get_player(resolved_tag)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+    except BaseException:
+        player_task.cancel()
+        raise
+    try:
+        player_info = await player_task
     except coc.errors.NotFound:
         await interaction.followup.send(f"⚠️ I could not find a player with tag `{resolved_tag}`.", ephemeral=True)
         return
@@ -1996,20 +2275,13 @@ async def plan_upgrade(
     """Launch the interactive planner used to record upgrade details."""
     _record_command_usage(interaction, "plan_upgrade")
     log.debug("plan_upgrade invoked clan=%s", clan_name)
+    await _defer_ephemeral(interaction, "plan_upgrade")
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    member = (
-        interaction.user
-        if isinstance(interaction.user, discord.Member)
-        else interaction.guild.get_member(interaction.user.id)
-    )
+    member = _resolve_member(interaction)
     if member is None:
         await send_text_response(
             interaction,
@@ -2019,21 +2291,7 @@ async def plan_upgrade(
         return
 
     guild_config = _ensure_guild_config(interaction.guild.id)
-    raw_accounts = guild_config.get("player_accounts", {}).get(str(member.id), [])
-    linked_accounts: List[Dict[str, Optional[str]]] = []
-    for record in raw_accounts:
-        if not isinstance(record, dict):
-            continue
-        tag = _normalise_player_tag(record.get("tag"))
-        if tag is None:
-            continue
-        alias_value = record.get("alias")
-        linked_accounts.append(
-            {
-                "tag": tag,
-                "alias": alias_value.strip() if isinstance(alias_value, str) and alias_value.strip() else None,
-            }
-        )
+    linked_accounts = _linked_accounts_for_member(interaction.guild.id, member.id)
 
     if not linked_accounts:
         await send_text_response(
@@ -2054,7 +2312,7 @@ async def plan_upgrade(
             ephemeral=True,
         )
         return
-    if not destination.permissions_for(destination.guild.me).send_messages:
+    if not _bot_can_post(destination):
         await send_text_response(
             interaction,
             "I don't have permission to post in the configured upgrade channel.",
@@ -2074,7 +2332,7 @@ async def plan_upgrade(
             return
         preselected_clan = candidate
     elif configured_clans:
-        preselected_clan = next(iter(configured_clans))
+        preselected_clan = _default_clan_for_guild(interaction.guild.id)
 
     view = PlanUpgradeView(
         guild=interaction.guild,
@@ -2085,15 +2343,7 @@ async def plan_upgrade(
         selected_clan=preselected_clan,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture plan_upgrade view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 # ---------------------------------------------------------------------------
 # Slash command: /set_upgrade_channel
@@ -2109,20 +2359,16 @@ async def set_upgrade_channel(interaction: discord.Interaction, channel: discord
     log.debug("set_upgrade_channel invoked channel=%s", channel.id)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
+    if not _is_admin(interaction.user):
         await send_text_response(
             interaction,
             "❌ Only administrators can set the upgrade channel.",
             ephemeral=True,
         )
         return
-    if not channel.permissions_for(channel.guild.me).send_messages:
+    if not _bot_can_post(channel):
         await send_text_response(
             interaction,
             "⚠️ I do not have permission to send messages in that channel.",
@@ -2132,7 +2378,7 @@ async def set_upgrade_channel(interaction: discord.Interaction, channel: discord
 
     guild_config = _ensure_guild_config(interaction.guild.id)
     guild_config.setdefault("channels", {})["upgrade"] = channel.id
-    save_server_config()
+    _schedule_config_save()
     await send_text_response(
         interaction,
         f"✅ Upgrade notices will now be posted in {channel.mention}.",
@@ -2150,28 +2396,14 @@ async def set_upgrade_channel(interaction: discord.Interaction, channel: discord
 @app_commands.describe(
     clan_name="Optional clan to preselect for configuration.",
 )
+@require_guild_admin("configure_donation_metrics", "configure donation metrics")
 async def configure_donation_metrics(
     interaction: discord.Interaction,
     clan_name: Optional[str] = None,
 ):
     """Update donation-tracking preferences for a clan."""
-    _record_command_usage(interaction, "configure_donation_metrics")
     log.debug("configure_donation_metrics invoked clan=%s", clan_name)
-
-    if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "⚠️ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
-        return
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
-        await send_text_response(
-            interaction,
-            "⚠️ Only administrators can configure donation metrics.",
-            ephemeral=True,
-        )
-        return
+    await _defer_ephemeral(interaction, "configure_donation_metrics")
 
     clan_map = _clan_names_for_guild(interaction.guild.id)
     if not clan_map:
@@ -2182,18 +2414,10 @@ async def configure_donation_metrics(
         )
         return
 
-    default_clan = clan_name if clan_name in clan_map else next(iter(clan_map))
+    default_clan = clan_name if clan_name in clan_map else _default_clan_for_guild(interaction.guild.id)
     view = DonationConfigView(interaction.guild, default_clan)
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Unable to capture configure_donation_metrics message handle: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
         
 # ---------------------------------------------------------------------------
@@ -2217,20 +2441,16 @@ async def set_donation_channel(
     log.debug("set_donation_channel invoked clan=%s channel=%s", clan_name, channel.id)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
+    if not _is_admin(interaction.user):
         await send_text_response(
             interaction,
             "❌ Only administrators can set the donation channel.",
             ephemeral=True,
         )
         return
-    if not channel.permissions_for(channel.guild.me).send_messages:
+    if not _bot_can_post(channel):
         await send_text_response(
             interaction,
             "⚠️ I don't have permission to post in that channel.",
@@ -2240,15 +2460,11 @@ async def set_donation_channel(
 
     clan_entry = _get_clan_entry(interaction.guild.id, clan_name)
     if clan_entry is None:
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
 
     clan_entry.setdefault("donation_tracking", {})["channel_id"] = channel.id
-    save_server_config()
+    _schedule_config_save()
     await send_text_response(
         interaction,
         f"✅ Donation summaries for `{clan_name}` will post in {channel.mention}.",
@@ -2274,20 +2490,12 @@ async def donation_summary(
     log.debug("donation_summary invoked clan=%s", clan_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     clan_entry = _get_clan_entry(interaction.guild.id, clan_name)
     if clan_entry is None:
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
 
     await interaction.response.defer(ephemeral=True, thinking=True)
@@ -2309,7 +2517,7 @@ async def donation_summary(
             else None
         )
     if destination is None:
-        destination = interaction.channel if isinstance(interaction.channel, discord.TextChannel) else None
+        destination = _as_text_channel(interaction.channel)
 
     if destination is None:
         await interaction.followup.send(
@@ -2317,18 +2525,19 @@ async def donation_summary(
             ephemeral=True,
         )
         return
-    if not destination.permissions_for(destination.guild.me).send_messages:
+    if not _bot_can_post(destination):
         await interaction.followup.send(
             "⚠️ I don't have permission to post in the selected channel.",
             ephemeral=True,
         )
         return
 
-    for chunk in _chunk_content(payload):
-        await destination.send(chunk)
-    csv_payload = _create_csv_file(context.get("csv_sections", []))
-    if csv_payload:
-        await destination.send(file=discord.File(BytesIO(csv_payload), filename="donation_summary.csv"))
+    csv_payload = await asyncio.to_thread(_create_csv_file, context.get("csv_sections", []))
+    await send_channel_message(
+        destination,
+        payload,
+        file=discord.File(csv_payload, filename="donation_summary.csv") if csv_payload else None,
+    )
 
     await interaction.followup.send(
         f"✅ Donation summary posted to {destination.mention}.",
@@ -2346,29 +2555,14 @@ async def donation_summary(
 @app_commands.describe(
     event_key="Optional event to preselect when the view opens.",
 )
+@require_guild_admin("configure_event_role", "configure event roles")
 async def configure_event_role(
     interaction: discord.Interaction,
     event_key: Optional[str] = None,
 ):
     '''Allow administrators to manage event opt-in roles via an interactive UI.'''
-    _record_command_usage(interaction, 'configure_event_role')
     log.debug('configure_event_role invoked event_key=%s', event_key)
-
-    if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            'This command must be used inside a Discord server.',
-            ephemeral=True,
-        )
-        return
-
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
-        await send_text_response(
-            interaction,
-            'Only administrators can configure event roles.',
-            ephemeral=True,
-        )
-        return
+    await _defer_ephemeral(interaction, "configure_event_role")
 
     events = _get_event_roles_for_guild(interaction.guild.id)
     if not events:
@@ -2386,15 +2580,7 @@ async def configure_event_role(
         selected_key=selected_key,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning('Unable to capture configure_event_role message handle: %s', exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 # ---------------------------------------------------------------------------
@@ -2420,14 +2606,10 @@ async def event_alert_opt(
     log.debug("event_alert_opt invoked event=%s enable=%s target=%s", event_type, enable, getattr(target_member, "id", None))
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    actor = interaction.user if isinstance(interaction.user, discord.Member) else interaction.guild.get_member(interaction.user.id)
+    actor = _resolve_member(interaction)
     if actor is None:
         await send_text_response(
             interaction,
@@ -2452,7 +2634,7 @@ async def event_alert_opt(
         return
 
     target = target_member or actor
-    if target != actor and not actor.guild_permissions.administrator:
+    if target != actor and not _is_admin(actor):
         await send_text_response(
             interaction,
             "Only administrators can toggle event roles for other members.",
@@ -2507,17 +2689,14 @@ async def event_alert_opt_autocomplete(
     """Provide dynamic autocomplete entries for configured events."""
     if interaction.guild is None:
         return []
-    events = _get_event_roles_for_guild(interaction.guild.id)
+    index = _event_search_index(interaction.guild.id)
     normalized = current.strip().casefold() if current else ""
-    choices: List[app_commands.Choice[str]] = []
-    for key, entry in events.items():
-        label = entry.get("label", _default_event_label(key))
-        if normalized and normalized not in label.casefold() and normalized not in key.casefold():
-            continue
-        choices.append(app_commands.Choice(name=label[:100], value=key))
-        if len(choices) >= 25:
-            break
-    return choices
+    matches = (
+        app_commands.Choice(name=name, value=key)
+        for name, label_folded, key_folded, key in index
+        if not normalized or normalized in label_folded or normalized in key_folded
+    )
+    return list(islice(matches, 25))
 
 # ---------------------------------------------------------------------------
 # Slash command: /register_me
@@ -2527,20 +2706,18 @@ async def register_me(interaction: discord.Interaction):
     """Provide buttons and guidance to help new members get set up quickly."""
     _record_command_usage(interaction, "register_me")
     log.debug("register_me invoked")
+    await _defer_ephemeral(interaction, "register_me")
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    war_alert_role = discord.utils.get(interaction.guild.roles, name=ALERT_ROLE_NAME)
+    war_alert_role = _get_alert_role(interaction.guild)
     event_roles: List[Dict[str, Any]] = []
     for key, entry in _get_event_roles_for_guild(interaction.guild.id).items():
         label = entry.get("label", _default_event_label(key))
-        role = _get_event_role(interaction.guild, key)
+        role_id = entry.get("role_id")
+        role = interaction.guild.get_role(role_id) if role_id is not None else None
         event_roles.append(
             {
                 "key": key,
@@ -2555,15 +2732,7 @@ async def register_me(interaction: discord.Interaction):
         event_roles=event_roles,
     )
 
-    await interaction.response.send_message(
-        view.build_intro_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture register_me message handle: %s", exc)
+    view.message = await _send_view_message(interaction, view.build_intro_message(), view)
 
 
 
@@ -2588,20 +2757,16 @@ async def set_season_summary_channel(
     log.debug("set_season_summary_channel invoked clan=%s channel=%s", clan_name, channel.id)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
+    if not _is_admin(interaction.user):
         await send_text_response(
             interaction,
             "❌ Only administrators can set the summary channel.",
             ephemeral=True,
         )
         return
-    if not channel.permissions_for(channel.guild.me).send_messages:
+    if not _bot_can_post(channel):
         await send_text_response(
             interaction,
             "⚠️ I do not have permission to post in that channel.",
@@ -2611,15 +2776,11 @@ async def set_season_summary_channel(
 
     clan_entry = _get_clan_entry(interaction.guild.id, clan_name)
     if clan_entry is None:
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
 
     clan_entry.setdefault("season_summary", {})["channel_id"] = channel.id
-    save_server_config()
+    _schedule_config_save()
     await send_text_response(
         interaction,
         f"✅ Seasonal summaries for `{clan_name}` will post in {channel.mention}.",
@@ -2646,16 +2807,13 @@ async def season_summary(
     """Launch the interactive composer used to build season summaries."""
     _record_command_usage(interaction, "season_summary")
     log.debug("season_summary invoked clan=%s channel=%s", clan_name, getattr(channel, "id", None))
+    await _defer_ephemeral(interaction, "season_summary")
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
+    if not _is_admin(interaction.user):
         await send_text_response(
             interaction,
             "Only administrators can generate seasonal summaries.",
@@ -2672,11 +2830,11 @@ async def season_summary(
         )
         return
 
-    selected_clan = clan_name if isinstance(clan_name, str) and clan_name in clan_map else next(iter(clan_map))
+    selected_clan = clan_name if isinstance(clan_name, str) and clan_name in clan_map else _default_clan_for_guild(interaction.guild.id)
 
     channel_id = None
     if channel is not None:
-        if not channel.permissions_for(channel.guild.me).send_messages:
+        if not _bot_can_post(channel):
             await send_text_response(
                 interaction,
                 "I do not have permission to send messages in that channel.",
@@ -2700,15 +2858,7 @@ async def season_summary(
         fallback_channel_id=fallback_channel.id if isinstance(fallback_channel, discord.TextChannel) else None,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture season_summary view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 
 # ---------------------------------------------------------------------------
@@ -2781,9 +2931,8 @@ def _format_unit_list(units: List[Dict[str, Any]], *, limit: int = 10, label: st
 def _format_achievement_list(achievements: List[Dict[str, Any]], *, limit: int = 5) -> str:
     if not achievements:
         return "No achievements recorded."
-    sorted_achievements = sorted(achievements, key=lambda item: item.get("stars", 0), reverse=True)
     lines = []
-    for achievement in sorted_achievements[:limit]:
+    for achievement in nlargest(limit, achievements, key=lambda item: item.get("stars", 0)):
         name = achievement.get("name", "Unknown")
         stars = achievement.get("stars", 0)
         value = achievement.get("value", 0)
@@ -2792,80 +2941,129 @@ def _format_achievement_list(achievements: List[Dict[str, Any]], *, limit: int =
         progress = (
             f"{value:,}/{target:,}" if isinstance(value, int) and isinstance(target, int) and target else f"{value:,}"
         )
-        detail = f"• {name}: ⭐ {stars} — {progress}"
-        if info:
-            detail += f" ({info})"
-        lines.append(detail)
-    if len(sorted_achievements) > limit:
-        lines.append(f"… (+{len(sorted_achievements) - limit} more)")
+        lines.append(f"• {name}: ⭐ {stars} — {progress}" + (f" ({info})" if info else ""))
+    if len(achievements) > limit:
+        lines.append(f"… (+{len(achievements) - limit} more)")
     return "\n".join(lines)
 
 
-def _format_timestamp_delta(source: datetime, duration_hours: int = 0) -> str:
-    """Format a timestamp relative to now as an hours/minutes/seconds countdown."""
-    if source.tzinfo is not None:
-        now = datetime.now(source.tzinfo)
-    else:
-        now = datetime.utcnow()
-    target = source + timedelta(hours=duration_hours)
-    remaining = target - now
-    if remaining.total_seconds() <= 0:
-        return "Completed"
-    hours, remainder = divmod(int(remaining.total_seconds()), 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f"{hours}h {minutes}m {seconds}s"
+def _format_timestamp_delta(
+    source: datetime,
+    duration_hours: int = 0,
+    *,
+    now: Optional[datetime] = None,
+) -> str:
+    """Format a timestamp relative to now as an hours/minutes/seconds countdown.
+
+    Callers formatting several timestamps can pass a shared ``now`` to read the clock once.
+    """
+    if now is None:
+        if source.tzinfo is not None:
+            now = datetime.now(source.tzinfo)
+        else:
+            now = datetime.utcnow()
+    target = source + timedelta(hours=duration_hours)
+    remaining = target - now
+    if remaining.total_seconds() <= 0:
+        return "Completed"
+    hours, remainder = divmod(int(remaining.total_seconds()), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}h {minutes}m {seconds}s"
+
+
+WAR_MEMBER_FIELDS = attrgetter("name", "town_hall", "star_count")
+WAR_TIME_KEYS = frozenset({"preparation start time", "war day start time", "war end time"})
+WAR_CLAN_KEYS = frozenset({"home clan", "opponent clan"})
+
+
+def _format_war_members(key: str, value, now: Optional[datetime]) -> Optional[str]:
+    """Format the war roster as one line per member."""
+    if not isinstance(value, Iterable):
+        return None
+    members: List[str] = []
+    for member in value:
+        try:
+            name, th, stars = WAR_MEMBER_FIELDS(member)
+        except AttributeError:
+            name = getattr(member, "name", "Unknown")
+            th = getattr(member, "town_hall", "?")
+            stars = getattr(member, "star_count", 0)
+        members.append(f"{name} (TH{th}) ⭐ {stars}")
+    return "\n".join(members) if members else "No members listed."
+
+
+def _format_war_attacks(key: str, value, now: Optional[datetime]) -> Optional[str]:
+    """Summarise how many attacks have been launched."""
+    if not isinstance(value, Iterable):
+        return None
+    try:
+        count = len(value)
+    except TypeError:
+        count = sum(1 for _ in value)
+    return "No attacks launched" if count == 0 else f"{count} attacks launched"
+
+
+def _format_war_time(key: str, value, now: Optional[datetime]) -> Optional[str]:
+    """Describe a war phase timestamp relative to now."""
+    source = getattr(value, "time", value)
+    if not isinstance(source, datetime):
+        return str(value)
+    if source.tzinfo is None:
+        source = source.replace(tzinfo=timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    if key == "war day start time":
+        if now >= source:
+            return "War Started"
+        return f"War begins in: {_format_timestamp_delta(source, 0, now=now)}"
+    if key == "war end time":
+        if now >= source:
+            return "War Ended"
+        return f"War ends in: {_format_timestamp_delta(source, 0, now=now)}"
+    delta_text = _format_timestamp_delta(source, 24, now=now)
+    return "Preparation Complete" if delta_text == "Completed" else f"Preparation phase remaining: {delta_text}"
+
+
+def _format_war_clan_side(key: str, value, now: Optional[datetime]) -> Optional[str]:
+    """Summarise one side of the war."""
+    if not hasattr(value, "name"):
+        return None
+    return (
+        f"{value.name} (TH avg unknown) — Stars: {getattr(value, 'stars', 'N/A')} "
+        f"| Attacks used: {getattr(value, 'attacks_used', 'N/A')} "
+        f"| Destruction: {getattr(value, 'destruction', 'N/A')}%"
+    )
+
+
+def _format_war_league_group(key: str, value, now: Optional[datetime]) -> Optional[str]:
+    """Summarise the CWL league group."""
+    if not hasattr(value, "season"):
+        return None
+    return f"Season {value.season} • State: {value.state}"
+
+
+# Key-specific war formatters; returning None falls back to the generic formatting.
+WAR_VALUE_FORMATTERS: Dict[str, Callable[[str, Any, Optional[datetime]], Optional[str]]] = {
+    "all members in war": _format_war_members,
+    "all attacks done this war": _format_war_attacks,
+    **dict.fromkeys(WAR_TIME_KEYS, _format_war_time),
+    **dict.fromkeys(WAR_CLAN_KEYS, _format_war_clan_side),
+    "league group": _format_war_league_group,
+}
 
 
-def _format_war_value(key: str, value) -> str:
+def _format_war_value(key: str, value, *, now: Optional[datetime] = None) -> str:
     """Human readable formatter for war information values."""
     log.debug("_format_war_value invoked for key %s", key)
     if value is None:
         return "Not available"
 
-    if key == "all members in war" and isinstance(value, Iterable):
-        members: List[str] = []
-        for member in value:
-            name = getattr(member, "name", "Unknown")
-            th = getattr(member, "town_hall", "?")
-            stars = getattr(member, "star_count", 0)
-            members.append(f"{name} (TH{th}) ⭐ {stars}")
-        return "\n".join(members) if members else "No members listed."
-
-    if key == "all attacks done this war" and isinstance(value, Iterable):
-        try:
-            count = len(value)
-        except TypeError:
-            count = sum(1 for _ in value)
-        return "No attacks launched" if count == 0 else f"{count} attacks launched"
-
-    if key in {"preparation start time", "war day start time", "war end time"}:
-        source = getattr(value, "time", value)
-        if not isinstance(source, datetime):
-            return str(value)
-        if source.tzinfo is None:
-            source = source.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-
-        if key == "war day start time":
-            if now >= source:
-                return "War Started"
-            return f"War begins in: {_format_timestamp_delta(source, 0)}"
-        if key == "war end time":
-            if now >= source:
-                return "War Ended"
-            return f"War ends in: {_format_timestamp_delta(source, 0)}"
-        delta_text = _format_timestamp_delta(source, 24)
-        return "Preparation Complete" if delta_text == "Completed" else f"Preparation phase remaining: {delta_text}"
-
-    if key in {"home clan", "opponent clan"} and hasattr(value, "name"):
-        return (
-            f"{value.name} (TH avg unknown) — Stars: {getattr(value, 'stars', 'N/A')} "
-            f"| Attacks used: {getattr(value, 'attacks_used', 'N/A')} "
-            f"| Destruction: {getattr(value, 'destruction', 'N/A')}%"
-        )
-
-    if key == "league group" and hasattr(value, "season"):
-        return f"Season {value.season} • State: {value.state}"
+    formatter = WAR_VALUE_FORMATTERS.get(key)
+    if formatter is not None:
+        text = formatter(key, value, now)
+        if text is not None:
+            return text
 
     if isinstance(value, bool):
         return "Yes" if value else "No"
@@ -2895,77 +3093,76 @@ def _build_war_output(clan_name: str, selections: List[str], war_info: Dict[str,
         )
         return "\n".join(lines)
 
+    now = datetime.now(timezone.utc)
     for key in selections:
         label = WAR_INFO_FIELD_MAP.get(key, key.title())
-        value = _format_war_value(key, war_info.get(key))
+        value = _format_war_value(key, war_info.get(key), now=now)
         lines.append(f"**{label}:**\n{value}")
     return "\n\n".join(lines)
 
 
-def _format_player_value(key: str, player_info: Dict[str, Any]) -> str:
-    """Human readable formatter for player information values."""
-    if key == "profile":
-        profile = player_info.get("profile", {})
-        return (
-            f"Name: {profile.get('name', 'Unknown')}\n"
-            f"Tag: {profile.get('tag', 'N/A')}\n"
-            f"Exp Level: {_fmt_numeric(profile.get('exp_level'))}\n"
-            f"Town Hall: TH{profile.get('town_hall_level') or ' ?'}\n"
-            f"Town Hall Weapon: {_fmt_numeric(profile.get('town_hall_weapon_level')) or 'N/A'}\n"
-            f"Builder Hall: BH{profile.get('builder_hall_level') or ' ?'} \n"
-            f"Legend Statistics: {profile.get('legend_statistics', 'N/A')}"
-        )
-
-    if key == "clan":
-        clan = player_info.get("clan", {})
-        if not clan.get("name"):
-            return "Not currently in a clan."
-        return (
-            f"Clan: {clan.get('name')}\n"
-            f"Tag: {clan.get('tag', 'N/A')}\n"
-            f"Role: {str(clan.get('role') or 'Member').replace('_', ' ').title()}"
-        )
+def _format_player_profile(player_info: Dict[str, Any]) -> str:
+    profile = player_info.get("profile", {})
+    return (
+        f"Name: {profile.get('name', 'Unknown')}\n"
+        f"Tag: {profile.get('tag', 'N/A')}\n"
+        f"Exp Level: {_fmt_numeric(profile.get('exp_level'))}\n"
+        f"Town Hall: TH{profile.get('town_hall_level') or ' ?'}\n"
+        f"Town Hall Weapon: {_fmt_numeric(profile.get('town_hall_weapon_level')) or 'N/A'}\n"
+        f"Builder Hall: BH{profile.get('builder_hall_level') or ' ?'} \n"
+        f"Legend Statistics: {profile.get('legend_statistics', 'N/A')}"
+    )
 
-    if key == "league":
-        league = player_info.get("league")
-        return (
-            f"League: {getattr(league, 'name', 'Unranked')}\n"
-            f"ID: {getattr(league, 'id', 'N/A')})\n"
-            f"Icon: {getattr(league, 'icon', 'N/A')})\n"
-            f"Attack wins: {_fmt_numeric(player_info.get('attack_wins'))}\n"
-            f"Defense wins: {_fmt_numeric(player_info.get('defense_wins'))}"
-        )
 
-    if key == "trophies_overview":
-        return (
-            f"Home: {_fmt_numeric(player_info.get('trophies'))} "
-            f"(Best: {_fmt_numeric(player_info.get('best_trophies'))})\n"
-            f"Builder Base: {_fmt_numeric(player_info.get('versus_trophies'))} "
-            f"(Best: {_fmt_numeric(player_info.get('best_builder_base_trophies'))})"
-        )
+def _format_player_clan(player_info: Dict[str, Any]) -> str:
+    clan = player_info.get("clan", {})
+    if not clan.get("name"):
+        return "Not currently in a clan."
+    return (
+        f"Clan: {clan.get('name')}\n"
+        f"Tag: {clan.get('tag', 'N/A')}\n"
+        f"Role: {str(clan.get('role') or 'Member').replace('_', ' ').title()}"
+    )
 
-    if key == "war_stats":
-        return (
-            f"War stars: {_fmt_numeric(player_info.get('war_stars'))}\n"
-        )
 
-    if key == "donations":
-        return (
-            f"Donations sent: {_fmt_numeric(player_info.get('donations'))}\n"
-            f"Donations received: {_fmt_numeric(player_info.get('donations_received'))}"
-        )
+def _format_player_league(player_info: Dict[str, Any]) -> str:
+    league = player_info.get("league")
+    return (
+        f"League: {getattr(league, 'name', 'Unranked')}\n"
+        f"ID: {getattr(league, 'id', 'N/A')})\n"
+        f"Icon: {getattr(league, 'icon', 'N/A')})\n"
+        f"Attack wins: {_fmt_numeric(player_info.get('attack_wins'))}\n"
+        f"Defense wins: {_fmt_numeric(player_info.get('defense_wins'))}"
+    )
 
-    if key == "heroes":
-        return _format_unit_list(player_info.get("heroes", []), label="Hero")
 
-    if key == "troops":
-        return _format_unit_list(player_info.get("troops", []), label="Troop")
+PLAYER_VALUE_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "profile": _format_player_profile,
+    "clan": _format_player_clan,
+    "league": _format_player_league,
+    "trophies_overview": lambda player_info: (
+        f"Home: {_fmt_numeric(player_info.get('trophies'))} "
+        f"(Best: {_fmt_numeric(player_info.get('best_trophies'))})\n"
+        f"Builder Base: {_fmt_numeric(player_info.get('versus_trophies'))} "
+        f"(Best: {_fmt_numeric(player_info.get('best_builder_base_trophies'))})"
+    ),
+    "war_stats": lambda player_info: f"War stars: {_fmt_numeric(player_info.get('war_stars'))}\n",
+    "donations": lambda player_info: (
+        f"Donations sent: {_fmt_numeric(player_info.get('donations'))}\n"
+        f"Donations received: {_fmt_numeric(player_info.get('donations_received'))}"
+    ),
+    "heroes": lambda player_info: _format_unit_list(player_info.get("heroes", []), label="Hero"),
+    "troops": lambda player_info: _format_unit_list(player_info.get("troops", []), label="Troop"),
+    "spells": lambda player_info: _format_unit_list(player_info.get("spells", []), label="Spell"),
+    "achievements": lambda player_info: _format_achievement_list(player_info.get("achievements", [])),
+}
 
-    if key == "spells":
-        return _format_unit_list(player_info.get("spells", []), label="Spell")
 
-    if key == "achievements":
-        return _format_achievement_list(player_info.get("achievements", []))
+def _format_player_value(key: str, player_info: Dict[str, Any]) -> str:
+    """Human readable formatter for player information values."""
+    formatter = PLAYER_VALUE_FORMATTERS.get(key)
+    if formatter is not None:
+        return formatter(player_info)
 
     value = player_info.get(key)
     if isinstance(value, bool):
@@ -2993,6 +3190,17 @@ def _build_player_output(player_label: str, selections: List[str], player_info:
     return "\n\n".join(lines)
 
 
+def _normalise_account_record(tag: Any, alias: Any) -> Optional[Dict[str, Optional[str]]]:
+    """Build a stored ``{"tag", "alias"}`` record, or None when the tag is unusable."""
+    if not isinstance(tag, str):
+        return None
+    tag = tag.strip()
+    if not tag:
+        return None
+    alias = alias.strip() or None if isinstance(alias, str) else None
+    return {"tag": tag.upper(), "alias": alias}
+
+
 def _normalise_player_accounts_map(raw: Any) -> Dict[str, List[Dict[str, Optional[str]]]]:
     """Ensure player account mappings use the expected structure."""
     if not isinstance(raw, dict):
@@ -3000,34 +3208,27 @@ def _normalise_player_accounts_map(raw: Any) -> Dict[str, List[Dict[str, Optiona
 
     normalised: Dict[str, List[Dict[str, Optional[str]]]] = {}
     for user_id, records in raw.items():
-        key = str(user_id)
-        entries: List[Dict[str, Optional[str]]] = []
         if isinstance(records, list):
-            source_iterable = records
+            pairs = (
+                (record.get("tag"), record.get("alias")) if isinstance(record, dict) else (record, None)
+                for record in records
+            )
         elif isinstance(records, dict):
-            source_iterable = [{"alias": alias, "tag": tag} for alias, tag in records.items()]
+            # Legacy alias -> tag mapping.
+            pairs = ((tag, alias) for alias, tag in records.items())
         else:
             continue
 
-        for record in source_iterable:
-            if isinstance(record, dict):
-                tag = record.get("tag")
-                if not isinstance(tag, str) or not tag.strip():
-                    continue
-                alias = record.get("alias")
-                entries.append(
-                    {
-                        "tag": tag.strip().upper(),
-                        "alias": alias.strip() if isinstance(alias, str) and alias.strip() else None,
-                    }
-                )
-            elif isinstance(record, str) and record.strip():
-                entries.append({"tag": record.strip().upper(), "alias": None})
+        entries = [entry for entry in starmap(_normalise_account_record, pairs) if entry is not None]
         if entries:
-            normalised[key] = entries
+            normalised[str(user_id)] = entries
     return normalised
 
 
+# Deletes every valid tag character; anything left over makes the tag invalid.
+CLAN_TAG_STRIP_TABLE = str.maketrans("", "", "#0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
 def _normalise_clan_tag(raw_tag: str) -> Optional[str]:
     """Normalise a clan tag string."""
     if not isinstance(raw_tag, str):
@@ -3037,10 +3238,7 @@ def _normalise_clan_tag(raw_tag: str) -> Optional[str]:
         return None
     if not cleaned.startswith("#"):
         cleaned = f"#{cleaned}"
-    if any(
-        char not in "#0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        for char in cleaned
-    ):
+    if cleaned.translate(CLAN_TAG_STRIP_TABLE):
         return None
     if len(cleaned) < 6:
         return None
@@ -3059,9 +3257,9 @@ def _default_event_label(event_key: str) -> str:
     return event_key.replace("_", " ").title()
 
 
-def _normalise_event_roles(container: Any) -> "OrderedDict[str, Dict[str, Any]]":
+def _normalise_event_roles(container: Any) -> Dict[str, Dict[str, Any]]:
     """Convert legacy or partial event role config data into a consistent form."""
-    events: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    events: Dict[str, Dict[str, Any]] = {}
     if isinstance(container, dict):
         if isinstance(container.get("events"), dict):
             source_items = list(container["events"].items())
@@ -3093,7 +3291,7 @@ def _normalise_event_roles(container: Any) -> "OrderedDict[str, Dict[str, Any]]"
     return events
 
 
-def _ensure_event_role_entries(guild_config: Dict[str, Any]) -> "OrderedDict[str, Dict[str, Any]]":
+def _ensure_event_role_entries(guild_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """Ensure the guild's event role configuration uses the standard schema."""
     container = guild_config.get("event_roles")
     if not isinstance(container, dict):
@@ -3108,19 +3306,77 @@ def _ensure_event_role_entries(guild_config: Dict[str, Any]) -> "OrderedDict[str
     return events
 
 
-def _get_event_roles_for_guild(guild_id: int) -> "OrderedDict[str, Dict[str, Any]]":
-    """Fetch a copy of the event role configuration for the given guild."""
+def _stored_event_entries(guild_id: int) -> Dict[str, Dict[str, Any]]:
+    """Return the guild's normalised event entries in place, without copying them."""
     guild_config = _ensure_guild_config(guild_id)
-    entries = _ensure_event_role_entries(guild_config)
-    return OrderedDict(
-        (key, {"label": value.get("label", _default_event_label(key)), "role_id": value.get("role_id") if isinstance(value.get("role_id"), int) else None})
+    container = guild_config.get("event_roles")
+    entries = container.get("events") if isinstance(container, dict) else None
+    if not isinstance(entries, dict):
+        entries = _ensure_event_role_entries(guild_config)
+    return entries
+
+
+def _get_event_roles_for_guild(guild_id: int) -> Dict[str, Dict[str, Any]]:
+    """Fetch a copy of the event role configuration for the given guild."""
+    entries = _stored_event_entries(guild_id)
+    return {
+        key: {"label": value.get("label", _default_event_label(key)), "role_id": value.get("role_id") if isinstance(value.get("role_id"), int) else None}
         for key, value in entries.items()
-    )
+    }
+
+
+def _event_search_index(guild_id: int) -> List[Tuple[str, str, str, str]]:
+    """Return (display name, folded label, folded key, key) rows for event autocomplete.
+
+    Rows are rebuilt only when the stored configuration changes.
+    """
+    version = get_config_version()
+    cached = _event_search_cache.get(guild_id)
+    if cached is None or cached[0] != version:
+        events = _get_event_roles_for_guild(guild_id)
+        rows = []
+        for key, entry in events.items():
+            label = entry.get("label", _default_event_label(key))
+            rows.append((label[:100], label.casefold(), key.casefold(), key))
+        cached = _event_search_cache[guild_id] = (version, rows)
+    return cached[1]
+
+
+EVENT_KEY_SLUG_RE = re.compile(r"[^a-z0-9]+")
+EVENT_LOOKUP_SEPARATOR_RE = re.compile(r"[\s_\-]+")
+
+
+def _normalise_event_lookup(text: str) -> str:
+    """Fold case and drop separators so event keys and labels compare loosely."""
+    return EVENT_LOOKUP_SEPARATOR_RE.sub("", text.casefold())
+
+
+def _event_match_index(guild_id: int) -> Tuple[List[str], Tuple[Dict[str, int], ...]]:
+    """Return event keys plus maps from folded/normalised key and label forms to the first matching position.
+
+    The maps are rebuilt only when the stored configuration changes.
+    """
+    version = get_config_version()
+    cached = _event_match_cache.get(guild_id)
+    if cached is None or cached[0] != version:
+        keys: List[str] = []
+        forms: Tuple[Dict[str, int], ...] = ({}, {}, {}, {})
+        key_folded, key_normalised, label_folded, label_normalised = forms
+        for position, (key, entry) in enumerate(_stored_event_entries(guild_id).items()):
+            keys.append(key)
+            key_folded.setdefault(key.casefold(), position)
+            key_normalised.setdefault(_normalise_event_lookup(key), position)
+            label = entry.get("label", _default_event_label(key))
+            if isinstance(label, str):
+                label_folded.setdefault(label.casefold(), position)
+                label_normalised.setdefault(_normalise_event_lookup(label), position)
+        cached = _event_match_cache[guild_id] = (version, keys, forms)
+    return cached[1], cached[2]
 
 
 def _slugify_event_key(name: str, existing_keys: Iterable[str]) -> str:
     """Generate a stable event key from a human-friendly label."""
-    base = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    base = EVENT_KEY_SLUG_RE.sub("_", name.lower()).strip("_")
     if not base:
         base = "event"
     candidate = base
@@ -3137,31 +3393,36 @@ def _resolve_event_selection(
     raw_value: str,
 ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
     """Resolve user-supplied event text into a configured event entry."""
-    events = _get_event_roles_for_guild(guild.id)
     if not raw_value or not raw_value.strip():
         return None, None
 
-    def _normalise(text: str) -> str:
-        return re.sub(r"[\s_\-]+", "", text.casefold())
-
-    lookup = raw_value.strip()
-    normalised_lookup = _normalise(lookup)
+    lookup = raw_value.strip().casefold()
+    normalised_lookup = _normalise_event_lookup(lookup)
+    keys, (key_folded, key_normalised, label_folded, label_normalised) = _event_match_index(guild.id)
 
-    for key, entry in events.items():
-        if key.casefold() == lookup.casefold() or _normalise(key) == normalised_lookup:
-            return key, entry
-
-    for key, entry in events.items():
-        label = entry.get("label")
-        if isinstance(label, str):
-            if label.casefold() == lookup.casefold() or _normalise(label) == normalised_lookup:
-                return key, entry
+    # Keys win over labels; within each, the earliest event matching either form wins.
+    for folded, normalised in ((key_folded, key_normalised), (label_folded, label_normalised)):
+        positions = [
+            position
+            for position in (folded.get(lookup), normalised.get(normalised_lookup))
+            if position is not None
+        ]
+        if positions:
+            key = keys[min(positions)]
+            return key, _get_event_roles_for_guild(guild.id)[key]
 
     return None, None
 
 
 def _ensure_guild_config(guild_id: int) -> Dict[str, Any]:
-    """Return the guild config, ensuring required keys exist."""
+    """Return the guild config, ensuring required keys exist.
+
+    Normalisation is skipped when the guild was already normalised since the last save.
+    """
+    version = get_config_version()
+    guild_config = server_config.get(guild_id)
+    if guild_config is not None and _normalised_guild_versions.get(guild_id) == version:
+        return guild_config
     guild_config = server_config.setdefault(guild_id, {"clans": {}, "player_tags": {}})
     clans = guild_config.setdefault("clans", {})
     for clan_data in clans.values():
@@ -3173,7 +3434,11 @@ def _ensure_guild_config(guild_id: int) -> Dict[str, Any]:
         else:
             alerts.setdefault("enabled", True)
             alerts.setdefault("channel_id", None)
-        clan_data.setdefault("war_plans", {})
+        war_plans = clan_data.setdefault("war_plans", {})
+        for plan in war_plans.values():
+            if isinstance(plan, dict):
+                # Saves always stamp updated_at; backfill older plans so reads can index directly.
+                plan.setdefault("updated_at", None)
         war_nudge = clan_data.setdefault("war_nudge", {})
         if not isinstance(war_nudge.get("reasons"), list):
             war_nudge["reasons"] = []
@@ -3263,6 +3528,7 @@ def _ensure_guild_config(guild_id: int) -> Dict[str, Any]:
         if clan_payload:
             normalised_state[clan_name] = clan_payload
     guild_config["war_alert_state"] = normalised_state
+    _normalised_guild_versions[guild_id] = version
     return guild_config
 
 
@@ -3293,12 +3559,23 @@ def _clan_names_for_guild(guild_id: int) -> Dict[str, str]:
     """Return a mapping of clan name -> tag for a guild."""
     log.debug("_clan_names_for_guild called")
     guild_config = _ensure_guild_config(guild_id)
-    clans = guild_config.get("clans", {}) or {}
-    return {
-        name: data.get("tag")
-        for name, data in clans.items()
-        if isinstance(data, dict) and data.get("tag")
-    }
+    version = get_config_version()
+    cached = _clan_map_cache.get(guild_id)
+    if cached is None or cached[0] != version:
+        clans = guild_config.get("clans", {}) or {}
+        clan_map = {
+            name: data.get("tag")
+            for name, data in clans.items()
+            if isinstance(data, dict) and data.get("tag")
+        }
+        cached = _clan_map_cache[guild_id] = (version, clan_map, next(iter(clan_map), None))
+    return dict(cached[1])
+
+
+def _default_clan_for_guild(guild_id: int) -> Optional[str]:
+    """Return the clan preselected when a command is invoked without one."""
+    _clan_names_for_guild(guild_id)
+    return _clan_map_cache[guild_id][2]
 
 
 def _get_clan_entry(guild_id: int, clan_name: str) -> Optional[Dict[str, Any]]:
@@ -3401,24 +3678,36 @@ def _collect_war_nudge_targets(
     return targets
 
 
+def _account_owners_by_tag(guild_id: int) -> Dict[str, List[int]]:
+    """Return player tag -> linked Discord user IDs, in stored order.
+
+    The index is rebuilt only when the stored configuration changes.
+    """
+    guild_config = _ensure_guild_config(guild_id)
+    version = get_config_version()
+    cached = _account_owner_cache.get(guild_id)
+    if cached is None or cached[0] != version:
+        owners: Dict[str, List[int]] = {}
+        for user_id_str, records in guild_config.get("player_accounts", {}).items():
+            if not isinstance(records, list) or not user_id_str.isdigit():
+                continue
+            user_id = int(user_id_str)
+            for record in records:
+                if isinstance(record, dict) and record.get("tag"):
+                    owners.setdefault(record["tag"], []).append(user_id)
+        cached = _account_owner_cache[guild_id] = (version, owners)
+    return cached[1]
+
+
 def _lookup_member_by_tag(
     guild: discord.Guild,
     tag: str,
 ) -> Optional[discord.Member]:
     """Attempt to resolve a Discord member from a player tag."""
-    guild_config = _ensure_guild_config(guild.id)
-    accounts = guild_config.get("player_accounts", {})
-    for user_id_str, records in accounts.items():
-        if not isinstance(records, list):
-            continue
-        for record in records:
-            if not isinstance(record, dict):
-                continue
-            if record.get("tag") == tag:
-                if user_id_str.isdigit():
-                    member = guild.get_member(int(user_id_str))
-                    if member:
-                        return member
+    for user_id in _account_owners_by_tag(guild.id).get(tag, ()):
+        member = guild.get_member(user_id)
+        if member:
+            return member
     return None
 
 
@@ -3442,9 +3731,7 @@ def _get_event_role(guild: discord.Guild, event_type: str) -> Optional[discord.R
     """Retrieve the configured event role for the given event type."""
     if guild is None or not isinstance(event_type, str):
         return None
-    guild_config = _ensure_guild_config(guild.id)
-    events = _ensure_event_role_entries(guild_config)
-    entry = events.get(event_type)
+    entry = _stored_event_entries(guild.id).get(event_type)
     if not isinstance(entry, dict):
         return None
     role_id = entry.get("role_id")
@@ -3460,6 +3747,21 @@ def _format_alert_message(role: Optional[discord.Role], message: str) -> str:
     return f"{prefix}{message}".strip()
 
 
+WAR_IDLE_STATES = frozenset({"notInWar", "inMatchmaking"})
+WAR_PRE_END_STATES = frozenset({"preparation", "inWar"})
+WAR_STARTED_STATES = frozenset({"inWar", "warEnded"})
+# (seconds before the milestone, alert id, message suffix) in the order alerts are queued.
+WAR_START_THRESHOLDS = (
+    (3600, "start_1h", "starts in 1 hour"),
+    (300, "start_5m", "starts in 5 minutes"),
+)
+WAR_END_THRESHOLDS = (
+    (43200, "end_12h", "ends in 12 hours"),
+    (3600, "end_1h", "ends in 1 hour"),
+    (300, "end_5m", "ends in 5 minutes"),
+)
+
+
 def _collect_war_alerts(
     guild: discord.Guild,
     clan_name: str,
@@ -3471,17 +3773,13 @@ def _collect_war_alerts(
     """Determine which alerts should fire for the current war snapshot."""
     log.debug("_collect_war_alerts invoked")
     state_value_str = war.state.value if hasattr(war.state, 'value') else war.state
-    if state_value_str in {'notInWar', 'inMatchmaking'}:
+    if state_value_str in WAR_IDLE_STATES:
         return []
 
     messages: List[str] = []  # Collected alert strings to return
     war_tag = war.war_tag or tag
     start_dt = _timestamp_to_datetime(war.start_time)
     end_dt = _timestamp_to_datetime(war.end_time)
-    if start_dt and start_dt.tzinfo is None:
-        start_dt = start_dt.replace(tzinfo=timezone.utc)
-    if end_dt and end_dt.tzinfo is None:
-        end_dt = end_dt.replace(tzinfo=timezone.utc)
 
     start_seconds_remaining = (
         (start_dt - now).total_seconds() if start_dt is not None else None
@@ -3501,25 +3799,21 @@ def _collect_war_alerts(
         if _mark_alert_sent(guild.id, clan_name, war_tag, alert_id):
             messages.append(_format_alert_message(role, text))
 
-    if state_value_str in {'preparation', 'inWar'}:
-        if _within_threshold_window(start_seconds_remaining, threshold=3600):
-            queue("start_1h", f"War for {clan_name} starts in 1 hour.")
-        if _within_threshold_window(start_seconds_remaining, threshold=300):
-            queue("start_5m", f"War for {clan_name} starts in 5 minutes.")
+    if state_value_str in WAR_PRE_END_STATES:
+        for threshold, alert_id, suffix in WAR_START_THRESHOLDS:
+            if _within_threshold_window(start_seconds_remaining, threshold=threshold):
+                queue(alert_id, f"War for {clan_name} {suffix}.")
 
-    if state_value_str in {'inWar', 'warEnded'}:
+    if state_value_str in WAR_STARTED_STATES:
         if _elapsed_within_window(seconds_since_start, target=300):
             queue("start_plus_5m", f"War for {clan_name} started 5 minutes ago. Good luck!")
 
-    if state_value_str in {'preparation', 'inWar'}:
-        if _within_threshold_window(end_seconds_remaining, threshold=43200):
-            queue("end_12h", f"War for {clan_name} ends in 12 hours.")
-        if _within_threshold_window(end_seconds_remaining, threshold=3600):
-            queue("end_1h", f"War for {clan_name} ends in 1 hour.")
-        if _within_threshold_window(end_seconds_remaining, threshold=300):
-            queue("end_5m", f"War for {clan_name} ends in 5 minutes.")
+    if state_value_str in WAR_PRE_END_STATES:
+        for threshold, alert_id, suffix in WAR_END_THRESHOLDS:
+            if _within_threshold_window(end_seconds_remaining, threshold=threshold):
+                queue(alert_id, f"War for {clan_name} {suffix}.")
 
-    if state_value_str in {'warEnded', 'inWar'}:
+    if state_value_str in WAR_STARTED_STATES:
         if _elapsed_within_window(seconds_since_end, target=0):
             home_stars = getattr(war.clan, 'stars', '?')
             enemy_stars = getattr(war.opponent, 'stars', '?')
@@ -3540,7 +3834,7 @@ def _collect_war_alerts(
 
 async def _fetch_war_overview(clan_name: str, tag: str) -> Tuple[str, str]:
     try:
-        war = await client.get_clan_war_raw(tag)
+        war = await _get_cached_clan_war(tag)
     except coc.errors.PrivateWarLog:
         return (
             "War Overview",
@@ -3566,26 +3860,27 @@ async def _fetch_war_overview(clan_name: str, tag: str) -> Tuple[str, str]:
         f"Team Size: {getattr(war, 'team_size', 'N/A')}",
         f"Score: {getattr(war.clan, 'stars', '?')} — {getattr(war.opponent, 'stars', '?')}",
     ]
+    now = datetime.now(timezone.utc)
     if start:
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
         if now < start:
-            lines.append(f"Begins: {start.isoformat()} ({_format_timestamp_delta(start, 0)} remaining)")
+            lines.append(f"Begins: {start.isoformat()} ({_format_timestamp_delta(start, 0, now=now)} remaining)")
         else:
             lines.append(f"Began: {start.isoformat()}")
     if end:
-        if end.tzinfo is None:
-            end = end.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
         if now < end:
-            lines.append(f"Ends: {end.isoformat()} ({_format_timestamp_delta(end, 0)} remaining)")
+            lines.append(f"Ends: {end.isoformat()} ({_format_timestamp_delta(end, 0, now=now)} remaining)")
         else:
             lines.append(f"Ended: {end.isoformat()}")
 
     return ("War Overview", "\n".join(lines))
 
 
+# coc.ClanMember always defines these slots, so plain attrgetters replace getattr-with-default.
+MEMBER_DONATIONS = attrgetter("donations")
+MEMBER_TROPHIES = attrgetter("trophies")
+MEMBER_TAG = attrgetter("tag")
+
+
 async def _compose_donation_summary(
     guild: discord.Guild,
     clan_name: str,
@@ -3602,7 +3897,7 @@ async def _compose_donation_summary(
         raise ValueError(f"`{clan_name}` has no stored clan tag.")
 
     try:
-        clan = await client.get_clan(tag)
+        clan = await _get_cached_clan(tag)
     except Exception as exc:
         raise ValueError(f"Unable to fetch clan data: {exc}") from exc
 
@@ -3610,76 +3905,59 @@ async def _compose_donation_summary(
     if not members:
         raise ValueError("I couldn't retrieve the member list for that clan.")
 
-    sections: List[str] = [f"📈 **Donation Summary — {clan.name}**"]
+    # Flat output lines joined once at the end; a blank line separates sections.
+    lines: List[str] = [f"📈 **Donation Summary — {clan.name}**"]
     csv_sections: List[Tuple[str, List[str], List[List[str]]]] = []
+    # Read each member's figures once; every metric below works on these rows.
+    rows = [
+        (member.name, MEMBER_DONATIONS(member), getattr(member, "donations_received", 0))
+        for member in members
+    ]
+    by_donated = itemgetter(1)
 
     if metrics.get("top_donors", True):
-        top_sorted = sorted(members, key=lambda m: getattr(m, "donations", 0), reverse=True)
-        top_entries = [
-            f"• {member.name}: {getattr(member, 'donations', 0):,} donated"
-            for member in top_sorted[:5]
-            if getattr(member, "donations", 0) > 0
-        ]
+        top_sorted = nlargest(10, rows, key=by_donated)
+        top_entries = [f"• {name}: {donated:,} donated" for name, donated, _ in top_sorted[:5] if donated > 0]
         if top_entries:
-            sections.append("🏅 **Top Donors**\n" + "\n".join(top_entries))
+            lines += ("", "🏅 **Top Donors**", *top_entries)
             csv_sections.append(
                 (
                     "Top Donors",
                     ["Member", "Donated"],
-                    [
-                        [member.name, str(getattr(member, "donations", 0))]
-                        for member in top_sorted[:10]
-                    ],
+                    [[name, str(donated)] for name, donated, _ in top_sorted],
                 )
             )
 
     if metrics.get("low_donors"):
-        low_sorted = sorted(members, key=lambda m: getattr(m, "donations", 0))
-        low_entries = [
-            f"• {member.name}: {getattr(member, 'donations', 0):,} donated"
-            for member in low_sorted[:5]
-        ]
+        low_sorted = nsmallest(10, rows, key=by_donated)
+        low_entries = [f"• {name}: {donated:,} donated" for name, donated, _ in low_sorted[:5]]
         if low_entries:
-            sections.append("🔻 **Lowest Donation Totals**\n" + "\n".join(low_entries))
+            lines += ("", "🔻 **Lowest Donation Totals**", *low_entries)
             csv_sections.append(
                 (
                     "Lowest Donation Totals",
                     ["Member", "Donated"],
-                    [
-                        [member.name, str(getattr(member, "donations", 0))]
-                        for member in low_sorted[:10]
-                    ],
+                    [[name, str(donated)] for name, donated, _ in low_sorted],
                 )
             )
 
     if metrics.get("negative_balance"):
-        negative = [
-            member
-            for member in members
-            if getattr(member, "donations", 0) - getattr(member, "donations_received", 0) < 0
-        ]
+        negative = [row for row in rows if row[1] - row[2] < 0]
         if negative:
-            lines = [
-                f"• {member.name}: {getattr(member, 'donations', 0):,} given vs {getattr(member, 'donations_received', 0):,} received"
-                for member in negative[:5]
-            ]
-            sections.append("⚠️ **Negative Donation Balance**\n" + "\n".join(lines))
+            lines += ("", "⚠️ **Negative Donation Balance**")
+            lines.extend(
+                f"• {name}: {donated:,} given vs {received:,} received"
+                for name, donated, received in negative[:5]
+            )
             csv_sections.append(
                 (
                     "Negative Donation Balance",
                     ["Member", "Donated", "Received"],
-                    [
-                        [
-                            member.name,
-                            str(getattr(member, "donations", 0)),
-                            str(getattr(member, "donations_received", 0)),
-                        ]
-                        for member in negative[:10]
-                    ],
+                    [[name, str(donated), str(received)] for name, donated, received in negative[:10]],
                 )
             )
 
-    payload = "\n\n".join(sections)
+    payload = "\n".join(lines)
     context = {
         "csv_sections": csv_sections,
     }
@@ -3702,18 +3980,24 @@ def _compose_event_opt_in_summary(guild: discord.Guild) -> Tuple[str, str]:
     return ("Event Opt-Ins", "\n".join(lines))
 
 
-def _create_csv_file(sections: List[Tuple[str, List[str], List[List[str]]]]) -> Optional[bytes]:
+def _create_csv_file(sections: List[Tuple[str, List[str], List[List[str]]]]) -> Optional[BytesIO]:
+    """Render CSV sections into a rewound buffer that can be handed straight to discord.File."""
     if not sections:
         return None
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    for title, headers, rows in sections:
-        writer.writerow([title])
-        if headers:
-            writer.writerow(headers)
-        writer.writerows(rows)
-        writer.writerow([])
-    return buffer.getvalue().encode("utf-8")
+    buffer = BytesIO()
+    # Encode while writing so the CSV never exists as a separate str copy.
+    text = TextIOWrapper(buffer, encoding="utf-8", newline="")
+    # One writerows call over every section: title, optional headers, rows, then a blank separator.
+    csv.writer(text).writerows(
+        chain.from_iterable(
+            chain(([title], headers) if headers else ([title],), rows, ([],))
+            for title, headers, rows in sections
+        )
+    )
+    text.flush()
+    text.detach()
+    buffer.seek(0)
+    return buffer
 
 
 def _sanitise_modules(modules: Iterable[str]) -> List[str]:
@@ -3733,6 +4017,45 @@ def _dashboard_defaults(clan_entry: Dict[str, Any]) -> Tuple[List[str], str, Opt
     return _sanitise_modules(modules), fmt, channel_id
 
 
+DashboardSection = Tuple[str, str, List[Tuple[str, List[str], List[List[str]]]]]
+
+
+async def _dashboard_war_overview(
+    guild: discord.Guild, clan_name: str, tag: str, clan_entry: Dict[str, Any]
+) -> DashboardSection:
+    title, text = await _fetch_war_overview(clan_name, tag)
+    return title, text, []
+
+
+async def _dashboard_donation_snapshot(
+    guild: discord.Guild, clan_name: str, tag: str, clan_entry: Dict[str, Any]
+) -> DashboardSection:
+    payload, _, context = await _compose_donation_summary(guild, clan_name, clan_entry)
+    return "Donation Snapshot", payload, context.get("csv_sections", [])
+
+
+async def _dashboard_upgrade_queue(
+    guild: discord.Guild, clan_name: str, tag: str, clan_entry: Dict[str, Any]
+) -> DashboardSection:
+    return await _compose_upgrade_snapshot(guild, clan_name, tag)
+
+
+async def _dashboard_event_opt_ins(
+    guild: discord.Guild, clan_name: str, tag: str, clan_entry: Dict[str, Any]
+) -> DashboardSection:
+    title, text = _compose_event_opt_in_summary(guild)
+    return title, text, []
+
+
+# Module key -> (section title used if the module fails, builder).
+DASHBOARD_MODULE_BUILDERS = {
+    "war_overview": ("War Overview", _dashboard_war_overview),
+    "donation_snapshot": ("Donation Snapshot", _dashboard_donation_snapshot),
+    "upgrade_queue": ("Upgrade Queue", _dashboard_upgrade_queue),
+    "event_opt_ins": ("Event Opt-Ins", _dashboard_event_opt_ins),
+}
+
+
 async def _generate_dashboard_content(
     guild: discord.Guild,
     clan_name: str,
@@ -3747,23 +4070,25 @@ async def _generate_dashboard_content(
     if not tag:
         raise ValueError(f"`{clan_name}` has no stored clan tag.")
 
+    # The fetching modules hit separate Clash API endpoints, so build every section concurrently.
+    selected = _sanitise_modules(modules)
+    results = await asyncio.gather(
+        *(DASHBOARD_MODULE_BUILDERS[module][1](guild, clan_name, tag, clan_entry) for module in selected),
+        return_exceptions=True,
+    )
+
     sections: List[Tuple[str, str]] = []
     csv_sections: List[Tuple[str, List[str], List[List[str]]]] = []
-
-    for module in _sanitise_modules(modules):
-        if module == "war_overview":
-            title, text = await _fetch_war_overview(clan_name, tag)
-            sections.append((title, text))
-        elif module == "donation_snapshot":
-            payload, _, context = await _compose_donation_summary(guild, clan_name, clan_entry)
-            sections.append(("Donation Snapshot", payload))
-            csv_sections.extend(context.get("csv_sections", []))
-        elif module == "upgrade_queue":
-            title, text, csv_data = await _compose_upgrade_snapshot(guild, clan_name, tag)
-            sections.append((title, text))
-            csv_sections.extend(csv_data)
-        elif module == "event_opt_ins":
-            sections.append(_compose_event_opt_in_summary(guild))
+    for module, result in zip(selected, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            log.warning("Dashboard module %s failed for clan %s: %s", module, clan_name, result)
+            sections.append((DASHBOARD_MODULE_BUILDERS[module][0], f"⚠️ {result}"))
+            continue
+        title, text, csv_data = result
+        sections.append((title, text))
+        csv_sections.extend(csv_data)
 
     return sections, csv_sections
 
@@ -3789,15 +4114,11 @@ async def _compose_upgrade_snapshot(
         return ("Upgrade Queue", "No planned upgrades logged for this server yet.", [])
 
     try:
-        clan = await client.get_clan(clan_tag)
+        clan = await _get_cached_clan(clan_tag)
     except Exception as exc:
         raise ValueError(f"Unable to fetch clan roster: {exc}") from exc
 
-    member_tags: Set[str] = {
-        getattr(member, "tag")
-        for member in getattr(clan, "members", [])
-        if getattr(member, "tag", None)
-    }
+    member_tags: Set[str] = set(filter(None, map(MEMBER_TAG, getattr(clan, "members", []))))
 
     def _matches(entry: Dict[str, Any]) -> bool:
         if entry.get("clan_name") == clan_name:
@@ -3806,13 +4127,16 @@ async def _compose_upgrade_snapshot(
             return True
         return entry.get("player_tag") in member_tags
 
-    relevant_entries = [entry for entry in reversed(upgrade_log) if isinstance(entry, dict) and _matches(entry)]
+    # Only the ten newest matches are shown, so stop scanning the log once they are found.
+    relevant_entries = list(
+        islice((entry for entry in reversed(upgrade_log) if isinstance(entry, dict) and _matches(entry)), 10)
+    )
     if not relevant_entries:
         return ("Upgrade Queue", "No recent upgrades logged for this clan.", [])
 
     lines: List[str] = []
     csv_rows: List[List[str]] = []
-    for entry in relevant_entries[:10]:
+    for entry in relevant_entries:
         alias = entry.get("alias") or entry.get("player_tag") or "Unknown account"
         upgrade_desc = entry.get("upgrade") or "Upgrade not specified"
         submitter = entry.get("user_name") or "Unknown member"
@@ -3820,10 +4144,10 @@ async def _compose_upgrade_snapshot(
         timestamp = _parse_iso_timestamp(entry.get("timestamp"))
         timestamp_text = timestamp.strftime("%Y-%m-%d %H:%M UTC") if timestamp else "Unknown time"
 
-        line = f"• {alias}: {upgrade_desc} — logged by {submitter} on {timestamp_text}"
-        if notes:
-            line += f"\n  Notes: {notes}"
-        lines.append(line)
+        lines.append(
+            f"• {alias}: {upgrade_desc} — logged by {submitter} on {timestamp_text}"
+            + (f"\n  Notes: {notes}" if notes else "")
+        )
         csv_rows.append(
             [
                 alias,
@@ -3849,7 +4173,7 @@ def _create_dashboard_embed(
     embed = discord.Embed(
         title=f"Dashboard — {clan_name}",
         colour=discord.Colour.blurple(),
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
     )
     for title, text in sections:
         text = text or "(no data)"
@@ -3884,7 +4208,7 @@ async def _send_dashboard(
     if output_format in {"csv", "both"}:
         csv_payload = _create_csv_file(csv_sections)
         if csv_payload:
-            files.append(discord.File(BytesIO(csv_payload), filename=f"dashboard_{clan_name}.csv"))
+            files.append(discord.File(csv_payload, filename=f"dashboard_{clan_name}.csv"))
 
     if embed and files:
         await destination.send(embed=embed, file=files[0])
@@ -3894,7 +4218,7 @@ async def _send_dashboard(
         await destination.send(file=files[0])
     else:
         payload = "\n\n".join(text for _, text in sections)
-        for chunk in _chunk_content(payload):
+        for chunk in _iter_chunks(payload):
             await destination.send(chunk)
 
     if interaction is not None:
@@ -3920,44 +4244,45 @@ async def _compose_season_summary(
         raise ValueError(f"`{clan_name}` has no stored tag.")
 
     try:
-        clan = await client.get_clan(tag)
+        clan = await _get_cached_clan(tag)
     except Exception as exc:
         raise ValueError(f"Unable to fetch clan data: {exc}") from exc
 
     members = list(getattr(clan, "members", []))
-    sections: List[str] = [f"🏁 **Season Summary — {clan.name}**"]
+    # Flat output lines joined once at the end; a blank line separates sections.
+    lines: List[str] = [f"🏁 **Season Summary — {clan.name}**"]
 
     if include_wars:
-        wars_section = (
-            f"• War wins: {getattr(clan, 'war_wins', 'N/A')}\n"
-            f"• War losses: {getattr(clan, 'war_losses', 'N/A')}\n"
-            f"• War ties: {getattr(clan, 'war_ties', 'N/A')}\n"
-            f"• Current streak: {getattr(clan, 'war_win_streak', 'N/A')}"
+        lines += (
+            "",
+            "⚔️ **War Performance**",
+            f"• War wins: {getattr(clan, 'war_wins', 'N/A')}",
+            f"• War losses: {getattr(clan, 'war_losses', 'N/A')}",
+            f"• War ties: {getattr(clan, 'war_ties', 'N/A')}",
+            f"• Current streak: {getattr(clan, 'war_win_streak', 'N/A')}",
         )
-        sections.append("⚔️ **War Performance**\n" + wars_section)
 
     if include_donations and members:
-        top_donor = max(members, key=lambda m: getattr(m, "donations", 0))
+        top_donor = max(members, key=MEMBER_DONATIONS)
         top_receiver = max(members, key=lambda m: getattr(m, "donations_received", 0))
-        donation_lines = [
-            f"• Top donor: {top_donor.name} ({getattr(top_donor, 'donations', 0):,})",
+        lines += (
+            "",
+            "🤝 **Donations**",
+            f"• Top donor: {top_donor.name} ({top_donor.donations:,})",
             f"• Most received: {top_receiver.name} ({getattr(top_receiver, 'donations_received', 0):,})",
-        ]
-        sections.append("🤝 **Donations**\n" + "\n".join(donation_lines))
+        )
 
     if include_members and members:
-        top_trophies = sorted(members, key=lambda m: getattr(m, "trophies", 0), reverse=True)[:5]
-        member_lines = [
-            f"• {member.name}: {getattr(member, 'trophies', 0):,} trophies"
-            for member in top_trophies
-        ]
-        sections.append("🏆 **Top Trophy Holders**\n" + "\n".join(member_lines))
+        top_trophies = nlargest(5, members, key=MEMBER_TROPHIES)
+        lines += ("", "🏆 **Top Trophy Holders**")
+        lines.extend(f"• {member.name}: {member.trophies:,} trophies" for member in top_trophies)
 
-    payload = "\n\n".join(sections)
+    payload = "\n".join(lines)
     default_channel_id = clan_entry.get("season_summary", {}).get("channel_id")
     return payload, default_channel_id
 
 
+@lru_cache(maxsize=256)
 def _parse_time_utc(time_str: str) -> Tuple[int, int]:
     try:
         hour_str, minute_str = time_str.split(":", 1)
@@ -3977,8 +4302,13 @@ def _calculate_next_run(
     reference: Optional[datetime] = None,
 ) -> str:
     hour, minute = _parse_time_utc(time_utc)
-    ref = reference or datetime.utcnow()
-    candidate = ref.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if reference is None:
+        ref = datetime.now(timezone.utc)
+    elif reference.tzinfo is None:
+        ref = reference.replace(tzinfo=timezone.utc)
+    else:
+        ref = reference.astimezone(timezone.utc)
+    candidate = datetime(ref.year, ref.month, ref.day, hour, minute, tzinfo=timezone.utc)
 
     if frequency == "daily":
         if candidate <= ref:
@@ -3996,18 +4326,21 @@ def _calculate_next_run(
     else:
         raise ValueError("Frequency must be daily or weekly.")
 
-    candidate = candidate.replace(tzinfo=timezone.utc)
     return candidate.isoformat()
 
 
 def _format_schedule_entry(schedule: Dict[str, Any]) -> str:
     next_run = schedule.get("next_run", "unknown")
-    friendly = f"ID `{schedule.get('id', 'n/a')}` — {schedule.get('type', 'unknown')} for `{schedule.get('clan_name', '?')}`"
-    friendly += f" every {schedule.get('frequency', 'daily')} at {schedule.get('time_utc', '00:00')} UTC"
-    if schedule.get("frequency") == "weekly" and schedule.get("weekday"):
-        friendly += f" on {schedule['weekday'].title()}"
-    friendly += f" (next run: {next_run})"
-    return friendly
+    weekday = (
+        f" on {schedule['weekday'].title()}"
+        if schedule.get("frequency") == "weekly" and schedule.get("weekday")
+        else ""
+    )
+    return (
+        f"ID `{schedule.get('id', 'n/a')}` — {schedule.get('type', 'unknown')} for `{schedule.get('clan_name', '?')}`"
+        f" every {schedule.get('frequency', 'daily')} at {schedule.get('time_utc', '00:00')} UTC"
+        f"{weekday} (next run: {next_run})"
+    )
 
 
 async def _execute_schedule(guild: discord.Guild, schedule: Dict[str, Any]) -> None:
@@ -4032,7 +4365,7 @@ async def _execute_schedule(guild: discord.Guild, schedule: Dict[str, Any]) -> N
         if destination is None:
             log.debug("Skipping dashboard schedule %s: no destination channel", schedule.get("id"))
             return
-        if not destination.permissions_for(destination.guild.me).send_messages:
+        if not _bot_can_post(destination):
             log.debug("Skipping dashboard schedule %s: lacking channel permissions", schedule.get("id"))
             return
         await _send_dashboard(
@@ -4044,43 +4377,46 @@ async def _execute_schedule(guild: discord.Guild, schedule: Dict[str, Any]) -> N
             destination=destination,
         )
     elif schedule_type == "donation_summary":
-        payload, default_channel_id, context = await _compose_donation_summary(guild, clan_name, clan_entry)
+        # Resolve the destination before fetching clan data so unusable schedules cost no API calls.
+        default_channel_id = clan_entry.get("donation_tracking", {}).get("channel_id")
         if destination is None and isinstance(default_channel_id, int):
             destination = guild.get_channel(default_channel_id)
         if destination is None:
             log.debug("Skipping donation schedule %s: no destination channel", schedule.get("id"))
             return
-        if not destination.permissions_for(destination.guild.me).send_messages:
+        if not _bot_can_post(destination):
             log.debug("Skipping donation schedule %s: lacking channel permissions", schedule.get("id"))
             return
-        for chunk in _chunk_content(payload):
-            await destination.send(chunk)
-        csv_payload = _create_csv_file(context.get("csv_sections", []))
-        if csv_payload:
-            await destination.send(file=discord.File(BytesIO(csv_payload), filename=f"donation_summary_{clan_name}.csv"))
+        payload, _, context = await _compose_donation_summary(guild, clan_name, clan_entry)
+        csv_payload = await asyncio.to_thread(_create_csv_file, context.get("csv_sections", []))
+        await send_channel_message(
+            destination,
+            payload,
+            file=discord.File(csv_payload, filename=f"donation_summary_{clan_name}.csv") if csv_payload else None,
+        )
     elif schedule_type == "season_summary":
         options = schedule.get("options", {})
         include_d = options.get("include_donations", True)
         include_w = options.get("include_wars", True)
         include_m = options.get("include_members", False)
-        payload, default_channel_id = await _compose_season_summary(
-            guild,
-            clan_name,
-            clan_entry,
-            include_donations=include_d,
-            include_wars=include_w,
-            include_members=include_m,
-        )
+        default_channel_id = clan_entry.get("season_summary", {}).get("channel_id")
         if destination is None and isinstance(default_channel_id, int):
             destination = guild.get_channel(default_channel_id)
         if destination is None:
             log.debug("Skipping season summary schedule %s: no destination channel", schedule.get("id"))
             return
-        if not destination.permissions_for(destination.guild.me).send_messages:
+        if not _bot_can_post(destination):
             log.debug("Skipping season summary schedule %s: lacking channel permissions", schedule.get("id"))
             return
-        for chunk in _chunk_content(payload):
-            await destination.send(chunk)
+        payload, _ = await _compose_season_summary(
+            guild,
+            clan_name,
+            clan_entry,
+            include_donations=include_d,
+            include_wars=include_w,
+            include_members=include_m,
+        )
+        await send_channel_message(destination, payload)
     else:
         log.debug("Unknown schedule type %s", schedule_type)
 
@@ -4106,14 +4442,10 @@ async def schedule_report(
     log.debug("schedule_report invoked schedule_id=%s clan=%s", schedule_id, clan_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
+    if not _is_admin(interaction.user):
         await send_text_response(
             interaction,
             "Only administrators can manage report schedules.",
@@ -4131,7 +4463,12 @@ async def schedule_report(
         return
 
     guild_config = _ensure_guild_config(interaction.guild.id)
-    schedules = copy.deepcopy(guild_config.get("schedules", []))
+    # Schedules are flat JSON records whose only nested value is the options dict.
+    schedules = [
+        {**entry, "options": dict(entry["options"]) if isinstance(entry.get("options"), dict) else {}}
+        for entry in guild_config.get("schedules", [])
+        if isinstance(entry, dict)
+    ]
 
     valid_ids = {entry.get("id") for entry in schedules if isinstance(entry, dict)}
     selected_schedule_id = schedule_id if schedule_id in valid_ids else None
@@ -4155,15 +4492,7 @@ async def schedule_report(
         selected_clan=preselected_clan,
     )
 
-    await interaction.response.send_message(
-        view.render_message(),
-        ephemeral=True,
-        view=view,
-    )
-    try:
-        view.message = await interaction.original_response()
-    except discord.HTTPException as exc:
-        log.warning("Failed to capture schedule_report view message: %s", exc)
+    view.message = await _send_view_message(interaction, view.render_message(), view)
 
 # ---------------------------------------------------------------------------
 # Slash command: /list_schedules
@@ -4181,14 +4510,10 @@ async def list_schedules(interaction: discord.Interaction, clan_name: Optional[s
     log.debug("list_schedules invoked clan=%s", clan_name)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
     member = interaction.user
-    if not isinstance(member, discord.Member) or not member.guild_permissions.administrator:
+    if not _is_admin(member):
         await send_text_response(
             interaction,
             "❌ Only administrators can view report schedules.",
@@ -4241,14 +4566,10 @@ async def cancel_schedule(interaction: discord.Interaction, schedule_id: str) ->
     log.debug("cancel_schedule invoked id=%s", schedule_id)
 
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command must be used inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
     member = interaction.user
-    if not isinstance(member, discord.Member) or not member.guild_permissions.administrator:
+    if not _is_admin(member):
         await send_text_response(
             interaction,
             "❌ Only administrators can cancel report schedules.",
@@ -4276,23 +4597,48 @@ async def cancel_schedule(interaction: discord.Interaction, schedule_id: str) ->
     )
 
 
+def _count_enabled_alert_clans() -> int:
+    """Return how many configured clans have war alerts enabled, recounted only after config changes."""
+    global _enabled_alert_clan_count
+    version = get_config_version()
+    if _enabled_alert_clan_count[0] != version:
+        count = 0
+        for guild_config in server_config.values():
+            clans = guild_config.get("clans") if isinstance(guild_config, dict) else None
+            if not isinstance(clans, dict):
+                continue
+            for clan_data in clans.values():
+                if not isinstance(clan_data, dict) or not clan_data.get("tag"):
+                    continue
+                alerts_cfg = clan_data.get("alerts")
+                if not isinstance(alerts_cfg, dict) or alerts_cfg.get("enabled", True):
+                    count += 1
+        _enabled_alert_clan_count = (version, count)
+    return _enabled_alert_clan_count[1]
+
+
 # Poll every five minutes so 5-minute alert thresholds are respected.
 @tasks.loop(minutes=5)
 async def war_alert_loop() -> None:
     """Poll tracked clans and emit time-based war reminders."""
     log.debug("war_alert_loop tick")
+    if not _count_enabled_alert_clans():
+        return  # Alert tracking is switched off everywhere
     now = datetime.now(timezone.utc)
+    active_guild_ids: List[int] = []
+    jobs: List[Tuple[discord.Guild, str, str, discord.TextChannel, Optional[discord.Role]]] = []
     for guild_id in list(server_config.keys()):
-        guild_config = _ensure_guild_config(guild_id)
         guild = bot.get_guild(guild_id)
         if guild is None:
             continue  # Skip guilds the bot is not currently connected to
 
+        guild_config = _ensure_guild_config(guild_id)
         clans: Dict[str, Dict[str, Any]] = guild_config.get("clans", {})  # type: ignore[assignment]
         if not clans:
             continue  # Nothing configured for this guild
 
-        alert_role = discord.utils.get(guild.roles, name=ALERT_ROLE_NAME)
+        active_guild_ids.append(guild_id)
+        alert_role = _get_alert_role(guild)
         default_channel = _find_alert_channel(guild)
 
         for clan_name, clan_data in clans.items():
@@ -4302,7 +4648,9 @@ async def war_alert_loop() -> None:
             if not tag:
                 continue
 
-            alerts_cfg = clan_data.get("alerts", {}) if isinstance(clan_data.get("alerts", {}), dict) else {}
+            alerts_cfg = clan_data.get("alerts")
+            if not isinstance(alerts_cfg, dict):
+                alerts_cfg = {}
             if not alerts_cfg.get("enabled", True):
                 continue  # Admins disabled tracking for this clan
 
@@ -4317,7 +4665,7 @@ async def war_alert_loop() -> None:
                         guild.id,
                     )
                     continue
-                if guild.me is None or not candidate.permissions_for(guild.me).send_messages:
+                if not _bot_can_post(candidate):
                     log.debug(
                         "Skipping alerts for %s in guild %s: insufficient permissions for channel %s",
                         clan_name,
@@ -4336,24 +4684,56 @@ async def war_alert_loop() -> None:
                     )
                     continue
 
-            try:
-                war = await client.get_clan_war_raw(tag)
-            except coc.errors.NotFound:
-                _clear_war_alert_state_for_clan(guild.id, clan_name)
-                continue  # Skip clans without accessible war data
-            except (coc.errors.PrivateWarLog, coc.errors.GatewayError):
-                continue  # Skip clans without accessible war data
-            except Exception:
-                continue  # Fail-safe for unexpected library errors
-
-            _prune_war_alert_state_for_clan(guild.id, clan_name, getattr(war, "war_tag", None) or tag)
-            for alert in _collect_war_alerts(guild, clan_name, tag, war, alert_role, now):
-                await send_channel_message(target_channel, alert)
-
-        if guild_id in _dirty_war_alert_state_guilds:
-            if _persist_war_alert_state_for_guild(guild_id):
-                save_server_config()
-            _dirty_war_alert_state_guilds.discard(guild_id)
+            jobs.append((guild, clan_name, tag, target_channel, alert_role))
+
+    # Fetch every tracked war concurrently; clans watched by several guilds share one request.
+    semaphore = asyncio.Semaphore(WAR_ALERT_FETCH_CONCURRENCY)
+
+    async def fetch_war(tag: str) -> Any:
+        async with semaphore:
+            return await _get_cached_clan_war(tag)
+
+    wars = await asyncio.gather(*(fetch_war(job[2]) for job in jobs), return_exceptions=True)
+    pending_alerts: Dict[int, Tuple[discord.TextChannel, List[str]]] = {}
+
+    for (guild, clan_name, tag, target_channel, alert_role), war in zip(jobs, wars):
+        if isinstance(war, coc.errors.NotFound):
+            _clear_war_alert_state_for_clan(guild.id, clan_name)
+            continue  # Skip clans without accessible war data
+        if isinstance(war, BaseException):
+            if not isinstance(war, Exception):
+                raise war
+            continue  # Private war logs, gateway errors and unexpected library errors
+
+        _prune_war_alert_state_for_clan(guild.id, clan_name, getattr(war, "war_tag", None) or tag)
+        alerts = _collect_war_alerts(guild, clan_name, tag, war, alert_role, now)
+        if alerts:
+            pending_alerts.setdefault(target_channel.id, (target_channel, []))[1].extend(alerts)
+
+    # Channels are posted to concurrently; alerts within a channel keep their order.
+    async def post_alerts(channel: discord.TextChannel, alerts: List[str]) -> None:
+        for alert in alerts:
+            await send_channel_message(channel, alert)
+
+    channel_batches = list(pending_alerts.values())
+    send_results = await asyncio.gather(
+        *(post_alerts(channel, alerts) for channel, alerts in channel_batches),
+        return_exceptions=True,
+    )
+    for (channel, _), result in zip(channel_batches, send_results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            log.warning("Failed to post war alerts to channel %s: %s", channel.id, result)
+
+    state_changed = False
+    for guild_id in active_guild_ids:
+        if guild_id in _dirty_war_alert_state_guilds and _persist_war_alert_state_for_guild(guild_id):
+            state_changed = True
+    _dirty_war_alert_state_guilds.difference_update(active_guild_ids)
+    if state_changed:
+        # One deferred save per tick; the file write happens off the event loop.
+        _schedule_config_save()
 
 
 @war_alert_loop.before_loop
@@ -4371,35 +4751,69 @@ def ensure_war_alert_loop_running() -> None:
         war_alert_loop.start()
 
 
+def _schedule_run_queue() -> List[Tuple[datetime, int, int, Dict[str, Any]]]:
+    """Return the heap of stored schedules ordered by their next run time.
+
+    The heap is rebuilt only when the stored configuration changes, so idle ticks
+    only peek at the earliest entry. Schedules without a valid next_run sort first.
+    """
+    global _schedule_queue
+    version = get_config_version()
+    if _schedule_queue[0] != version:
+        earliest = datetime.min.replace(tzinfo=timezone.utc)
+        heap: List[Tuple[datetime, int, int, Dict[str, Any]]] = []
+        for guild_id in list(server_config):
+            schedules = _ensure_guild_config(guild_id).get("schedules", [])
+            for position, schedule in enumerate(schedules):
+                next_run = _parse_iso_timestamp(schedule.get("next_run"))
+                heap.append((next_run or earliest, guild_id, position, schedule))
+        heapify(heap)
+        _schedule_queue = (version, heap)
+    return _schedule_queue[1]
+
+
 @tasks.loop(minutes=1)
 async def report_schedule_loop() -> None:
     """Poll stored schedules and execute any that are due."""
     log.debug("report_schedule_loop tick")
     now = datetime.now(timezone.utc)
-    for guild_id, _ in server_config.items():
-        guild = bot.get_guild(guild_id)
+    queue = _schedule_run_queue()
+    due: List[Tuple[discord.Guild, Dict[str, Any]]] = []
+    waiting: List[Tuple[datetime, int, int, Dict[str, Any]]] = []
+    while queue and queue[0][0] <= now:
+        item = heappop(queue)
+        guild = bot.get_guild(item[1])
         if guild is None:
+            # Keep it queued so it runs once the guild becomes available again.
+            waiting.append(item)
             continue
-        guild_config = _ensure_guild_config(guild_id)
-        schedules = guild_config.get("schedules", [])
-        modified = False
-        for schedule in schedules:
-            next_run_str = schedule.get("next_run")
-            next_run = _parse_iso_timestamp(next_run_str) if isinstance(next_run_str, str) else None
-            if next_run is None or next_run <= now:
-                try:
-                    await _execute_schedule(guild, schedule)
-                except Exception:
-                    log.exception("Error while executing schedule %s", schedule.get("id"))
-                finally:
-                    schedule["next_run"] = _calculate_next_run(
-                        schedule.get("frequency", "daily"),
-                        schedule.get("time_utc", "00:00"),
-                        weekday=schedule.get("weekday"),
-                    )
-                    modified = True
-        if modified:
-            save_server_config()
+        due.append((guild, item[3]))
+    for item in waiting:
+        heappush(queue, item)
+
+    if not due:
+        return
+
+    # Schedules that fall on the same tick run concurrently instead of one after another.
+    results = await asyncio.gather(
+        *(_execute_schedule(guild, schedule) for guild, schedule in due),
+        return_exceptions=True,
+    )
+    for (_, schedule), result in zip(due, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            log.error(
+                "Error while executing schedule %s",
+                schedule.get("id"),
+                exc_info=result,
+            )
+        schedule["next_run"] = _calculate_next_run(
+            schedule.get("frequency", "daily"),
+            schedule.get("time_utc", "00:00"),
+            weekday=schedule.get("weekday"),
+        )
+    _schedule_config_save()
 
 
 @report_schedule_loop.before_loop
@@ -4485,11 +4899,7 @@ async def clan_war_info_menu(interaction: discord.Interaction, clan_name: str):
     _record_command_usage(interaction, "clan_war_info_menu")
     log.debug("clan_war_info_menu invoked")
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command is only available inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     await interaction.response.defer(ephemeral=True, thinking=True)
@@ -4648,7 +5058,11 @@ class ChannelFilterModal(discord.ui.Modal):
         query = self.query.value.strip().lower()
         channels = self.parent_view.current_channel_candidates
         if query:
-            channels = [channel for channel in channels if query in channel.name.lower()]
+            channels = [
+                channel
+                for channel, name in self.parent_view.current_channel_search_names
+                if query in name
+            ]
         if not channels:
             await interaction.response.send_message(
                 "⚠️ No channels matched that filter. Try a different phrase.", ephemeral=True
@@ -4711,12 +5125,18 @@ class ChooseWarAlertChannelView(discord.ui.View):
         self.channels_by_category = channels_by_category
         self.selected_category_id: Optional[int] = None
         self.current_channel_candidates: List[discord.TextChannel] = []
+        # Lowercased names paired with their channels, computed once per category for the filter modal.
+        self.current_channel_search_names: List[Tuple[discord.TextChannel, str]] = []
         self.channel_select: Optional[ChannelChoiceSelect] = None
         self.filter_button: Optional[ChannelFilterButton] = None
         self.category_selected = False
 
-        category_options = self._build_category_options()
-        self.add_item(CategorySelect(self, category_options))
+        # Resolve every category name in one sweep; the option list is built once and reused.
+        self._category_names: Dict[int, str] = {
+            category.id: category.name for category in guild.categories
+        }
+        self._category_options = self._build_category_options()
+        self.add_item(CategorySelect(self, self._category_options))
 
     def _build_category_options(self) -> List[discord.SelectOption]:
         options: List[discord.SelectOption] = []
@@ -4726,11 +5146,7 @@ class ChooseWarAlertChannelView(discord.ui.View):
             if category_id is None:
                 label = "No Category"
             else:
-                category = self.guild.get_channel(category_id)
-                if isinstance(category, discord.CategoryChannel):
-                    label = category.name[:100]
-                else:
-                    label = "Unknown Category"
+                label = self._category_names.get(category_id, "Unknown Category")[:100]
             options.append(
                 discord.SelectOption(
                     label=label,
@@ -4750,11 +5166,7 @@ class ChooseWarAlertChannelView(discord.ui.View):
         category_label = (
             "No Category"
             if self.selected_category_id is None
-            else (
-                self.guild.get_channel(self.selected_category_id).name
-                if isinstance(self.guild.get_channel(self.selected_category_id), discord.CategoryChannel)
-                else "Unknown Category"
-            )
+            else self._category_names.get(self.selected_category_id, "Unknown Category")
         )
         return (
             f"Category selected: **{category_label}**.\n"
@@ -4770,6 +5182,9 @@ class ChooseWarAlertChannelView(discord.ui.View):
         self.selected_category_id = category_id
         self.category_selected = True
         self.current_channel_candidates = self.channels_by_category.get(category_id, [])
+        self.current_channel_search_names = [
+            (channel, channel.name.lower()) for channel in self.current_channel_candidates
+        ]
 
         # Remove previous widgets if they exist.
         if self.channel_select:
@@ -4825,7 +5240,9 @@ class ChooseWarAlertChannelView(discord.ui.View):
             )
             return
 
-        alerts = clan_entry.setdefault("alerts", {"enabled": True, "channel_id": None})
+        alerts = clan_entry.get("alerts")
+        if not isinstance(alerts, dict):
+            alerts = clan_entry["alerts"] = {"enabled": True, "channel_id": None}
         alerts["channel_id"] = channel.id
         save_server_config()
 
@@ -4859,9 +5276,7 @@ class AssignBasesModeView(discord.ui.View):
         self.home_roster = home_roster
         self.enemy_positions = sorted(int(pos) for pos in enemy_positions)
         self.alert_role = alert_role
-        self.channel: Optional[discord.TextChannel] = (
-            interaction.channel if isinstance(interaction.channel, discord.TextChannel) else None
-        )
+        self.channel: Optional[discord.TextChannel] = _as_text_channel(interaction.channel)
 
     def _disable(self) -> None:
         for child in self.children:
@@ -4930,9 +5345,12 @@ class PerPlayerAssignmentView(discord.ui.View):
         self.clan_name = parent.clan_name
         self.home_roster = home_roster
         self.enemy_positions = sorted(int(pos) for pos in enemy_positions)
-        self._valid_enemy_positions: Set[int] = set(self.enemy_positions)
+        self._valid_enemy_positions: FrozenSet[int] = frozenset(self.enemy_positions)
         self.alert_role = alert_role
         self.assignments: Dict[int, List[int]] = {}
+        # Formatted assignment lines shared by the status and broadcast messages; reset on change.
+        self._assignment_lines: Optional[List[str]] = None
+        self._target_text: Dict[int, str] = {}
         self.message: Optional[discord.Message] = None
         self._add_home_base_selects()
         log.debug("PerPlayerAssignmentView initialised children=%s", [
@@ -4946,22 +5364,21 @@ class PerPlayerAssignmentView(discord.ui.View):
         if not sorted_bases:
             return
 
-        chunks: List[List[int]] = [
-            sorted_bases[i : i + 25] for i in range(0, len(sorted_bases), 25)
-        ]
+        # Only the select groups that fit (five rows of 25) are sliced out of the roster.
+        chunk_count = (len(sorted_bases) + 24) // 25
+        if chunk_count > 5:
+            log.warning(
+                "PerPlayerAssignmentView has %s select groups; truncating display after row 4",
+                chunk_count,
+            )
         buttons = [child for child in self.children if isinstance(child, discord.ui.Button)]
         for button in buttons:
             self.remove_item(button)
-        for index, chunk in enumerate(chunks):
-            if index >= 5:
-                log.warning(
-                    "PerPlayerAssignmentView has more than 5 select groups; truncating display after row %s",
-                    index - 1,
-                )
-                break
+        for index in range(min(5, chunk_count)):
+            chunk = sorted_bases[index * 25 : index * 25 + 25]
             start = chunk[0]
             end = chunk[-1]
-            if len(chunks) == 1:
+            if chunk_count == 1:
                 placeholder = "Pick a home base to assign targets."
             else:
                 placeholder = f"Bases {start} - {end}"
@@ -4975,7 +5392,7 @@ class PerPlayerAssignmentView(discord.ui.View):
                 )
             )
 
-        button_start_row = min(4, len(chunks))
+        button_start_row = min(4, chunk_count)
         for idx, button in enumerate(buttons):
             button.row = min(4, button_start_row + idx)
             self.add_item(button)
@@ -4991,16 +5408,20 @@ class PerPlayerAssignmentView(discord.ui.View):
                 child.row = next_row
                 next_row += 1
 
+    def _format_assignment_lines(self) -> List[str]:
+        """Return one "[base] name: targets" line per assignment, ordered by base."""
+        if self._assignment_lines is None:
+            self._assignment_lines = [
+                f"[{base}] {self.home_roster.get(base, f'Base {base}')}: {self._target_text[base]}"
+                for base in sorted(self.assignments)
+            ]
+        return self._assignment_lines
+
     def render_message(self) -> str:
         if not self.assignments:
             details = "No assignments captured yet."
         else:
-            lines = []
-            for base in sorted(self.assignments.keys()):
-                member_name = self.home_roster.get(base, f"Base {base}")
-                targets = " and ".join(str(num) for num in self.assignments[base])
-                lines.append(f"[{base}] {member_name}: {targets}")
-            details = "\n".join(lines)
+            details = "\n".join(self._format_assignment_lines())
         return (
             "Per-player mode: pick a home base from the dropdown, enter the target base numbers when prompted, "
             "and repeat until you're ready to broadcast.\n"
@@ -5010,9 +5431,13 @@ class PerPlayerAssignmentView(discord.ui.View):
 
     def update_assignment(self, base: int, targets: List[int]) -> None:
         self.assignments[base] = targets
+        self._target_text[base] = " and ".join(map(str, targets))
+        self._assignment_lines = None
 
     def clear_assignments(self) -> None:
         self.assignments.clear()
+        self._target_text.clear()
+        self._assignment_lines = None
 
     async def _refresh_message(self) -> None:
         """Update the interactive message with the latest assignment summary."""
@@ -5033,13 +5458,8 @@ class PerPlayerAssignmentView(discord.ui.View):
     def build_broadcast_content(self) -> Optional[str]:
         if not self.assignments:
             return None
-        lines: List[str] = []
-        for base in sorted(self.assignments.keys()):
-            member_name = self.home_roster.get(base, f"Base {base}")
-            target_text = " and ".join(str(num) for num in self.assignments[base])
-            lines.append(f"[{base}] {member_name}: {target_text}")
         mention = f"{self.alert_role.mention} " if self.alert_role else ""
-        return f"{mention}Assignments for `{self.clan_name}`\n" + "\n".join(lines)
+        return f"{mention}Assignments for `{self.clan_name}`\n" + "\n".join(self._format_assignment_lines())
 
     async def on_error(
         self,
@@ -5086,7 +5506,7 @@ class PerPlayerAssignmentView(discord.ui.View):
         if self.message is None and interaction.message is not None:
             self.message = interaction.message
         channel = self.parent.channel
-        if channel is None or not channel.permissions_for(self.guild.me).send_messages:
+        if channel is None or not _bot_can_post(channel):
             await interaction.response.send_message(
                 "⚠️ I don't have permission to post in this channel. Try again after adjusting permissions.",
                 ephemeral=True,
@@ -5100,8 +5520,7 @@ class PerPlayerAssignmentView(discord.ui.View):
         await self._refresh_message()
 
         try:
-            for chunk in _chunk_content(content):
-                await channel.send(chunk)
+            await send_channel_message(channel, content)
         except discord.HTTPException as exc:
             log.exception(
                 "PerPlayerAssignmentView failed to post assignments for clan %s: %s",
@@ -5190,6 +5609,10 @@ class HomeBaseSelect(discord.ui.Select):
         await interaction.response.send_modal(modal)
 
 
+# One or two enemy base numbers separated by a comma; stray commas and spaces are tolerated.
+ASSIGNMENT_TARGETS_RE = re.compile(r"^[\s,]*(\d+)(?:\s*,[\s,]*(\d+))?[\s,]*$")
+
+
 class AssignmentModal(discord.ui.Modal):
     """Modal that captures up to two enemy base numbers for a selected home base."""
 
@@ -5206,23 +5629,14 @@ class AssignmentModal(discord.ui.Modal):
         self.add_item(self.targets)
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
-        raw = self.targets.value.replace(" ", "")
-        parts = [part for part in raw.split(",") if part]
-        try:
-            numbers = [int(part) for part in parts]
-        except ValueError:
-            await interaction.response.send_message(
-                "⚠️ Please enter whole numbers separated by commas.",
-                ephemeral=True,
-            )
-            return
-
-        if not numbers or len(numbers) > 2:
+        match = ASSIGNMENT_TARGETS_RE.match(self.targets.value)
+        if match is None:
             await interaction.response.send_message(
-                "⚠️ Provide one or two enemy base numbers.",
+                "⚠️ Provide one or two enemy base numbers as whole numbers separated by a comma.",
                 ephemeral=True,
             )
             return
+        numbers = [int(group) for group in match.groups() if group is not None]
 
         invalid_targets = [
             num for num in numbers if num not in self.parent_view._valid_enemy_positions
@@ -5287,7 +5701,7 @@ class GeneralAssignmentModal(discord.ui.Modal):
             return
 
         channel = self.parent.channel
-        if channel is None or not channel.permissions_for(self.parent.guild.me).send_messages:
+        if channel is None or not _bot_can_post(channel):
             await interaction.response.send_message(
                 "⚠️ I cannot send messages to this channel. Adjust permissions and try again.",
                 ephemeral=True,
@@ -5296,8 +5710,7 @@ class GeneralAssignmentModal(discord.ui.Modal):
 
         mention = f"{self.parent.alert_role.mention} " if self.parent.alert_role else ""
         content = f"{mention}General assignment for `{self.parent.clan_name}`\n{text}"
-        for chunk in _chunk_content(content):
-            await channel.send(chunk)
+        await send_channel_message(channel, content)
 
         log.debug(
             "GeneralAssignmentModal broadcast for clan %s: %s",
@@ -5411,7 +5824,7 @@ class DashboardConfigView(discord.ui.View):
 
     @discord.ui.button(label="Save", style=discord.ButtonStyle.success)
     async def confirm(self, interaction: discord.Interaction, _: discord.ui.Button) -> None:  # type: ignore[override]
-        if not isinstance(interaction.user, discord.Member) or not interaction.user.guild_permissions.administrator:
+        if not _is_admin(interaction.user):
             await interaction.response.send_message(
                 "⚠️ Only administrators can update the dashboard configuration.",
                 ephemeral=True,
@@ -5735,7 +6148,7 @@ class EventRoleConfigView(discord.ui.View):
         self,
         *,
         guild: discord.Guild,
-        events: "OrderedDict[str, Dict[str, Any]]",
+        events: Dict[str, Dict[str, Any]],
         selected_key: str,
         timeout: float = 300,
     ):
@@ -5743,7 +6156,7 @@ class EventRoleConfigView(discord.ui.View):
         self.guild = guild
         self.message: Optional[discord.Message] = None
         copied_events = copy.deepcopy(events)
-        self.events: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.events: Dict[str, Dict[str, Any]] = {}
         for key, entry in copied_events.items():
             if not isinstance(key, str):
                 continue
@@ -5782,8 +6195,8 @@ class EventRoleConfigView(discord.ui.View):
         return _default_event_label(self.selected_key)
 
     def user_is_admin(self, interaction: discord.Interaction) -> bool:
-        member = interaction.user if isinstance(interaction.user, discord.Member) else self.guild.get_member(interaction.user.id)
-        return bool(member and member.guild_permissions.administrator)
+        member = _resolve_member(interaction)
+        return _is_admin(member)
 
     def refresh_components(self) -> None:
         self.clear_items()
@@ -5991,7 +6404,7 @@ class EventRoleConfigView(discord.ui.View):
         )
 
     async def handle_save(self, interaction: discord.Interaction) -> None:
-        payload: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        payload: Dict[str, Dict[str, Any]] = {}
         for key, entry in self.events.items():
             payload[key] = {
                 "label": entry.get("label", _default_event_label(key)),
@@ -6140,7 +6553,7 @@ class DashboardRunPreviewButton(discord.ui.Button):
         if self.parent_view.selected_format in {"csv", "both"}:
             csv_payload = _create_csv_file(csv_sections)
             if csv_payload:
-                files.append(discord.File(BytesIO(csv_payload), filename=f"dashboard_{self.parent_view.selected_clan}.csv"))
+                files.append(discord.File(csv_payload, filename=f"dashboard_{self.parent_view.selected_clan}.csv"))
 
         message = "Here is the current dashboard preview."
         if embed or files:
@@ -6170,7 +6583,7 @@ class DashboardRunPostButton(discord.ui.Button):
                 ephemeral=True,
             )
             return
-        if not channel.permissions_for(channel.guild.me).send_messages:
+        if not _bot_can_post(channel):
             await interaction.response.send_message(
                 "I don't have permission to post in that channel.",
                 ephemeral=True,
@@ -6741,7 +7154,7 @@ class PlanUpgradeView(discord.ui.View):
         lines.append(f"Submitted: {submission_time}")
 
         payload = "\n".join(lines)
-        for chunk in _chunk_content(payload):
+        for chunk in _iter_chunks(payload):
             await self.destination_channel.send(chunk)
 
         log_entry = {
@@ -8265,7 +8678,7 @@ class WarPlanPostView(discord.ui.View):
         self.refresh_components()
 
     def set_channel(self, channel: Optional[discord.abc.GuildChannel]) -> None:
-        self.explicit_channel = channel if isinstance(channel, discord.TextChannel) else None
+        self.explicit_channel = _as_text_channel(channel)
         self.refresh_components()
 
     def get_plan_payload(self) -> Optional[Dict[str, Any]]:
@@ -9106,14 +9519,14 @@ class SeasonSummaryView(discord.ui.View):
                 ephemeral=True,
             )
             return
-        if not destination.permissions_for(destination.guild.me).send_messages:
+        if not _bot_can_post(destination):
             await interaction.response.send_message(
                 "I don't have permission to post in the selected channel.",
                 ephemeral=True,
             )
             return
 
-        for chunk in _chunk_content(payload):
+        for chunk in _iter_chunks(payload):
             await destination.send(chunk)
 
         await interaction.response.send_message(
@@ -9237,7 +9650,7 @@ class LinkPlayerTargetSelect(discord.ui.UserSelect):
                 ephemeral=True,
             )
             return
-        if not interaction.user.guild_permissions.administrator:
+        if not _is_admin(interaction.user):
             await interaction.response.send_message(
                 "⚠️ Only administrators can change the target member.",
                 ephemeral=True,
@@ -9381,7 +9794,7 @@ class LinkPlayerView(discord.ui.View):
     def refresh_components(self) -> None:
         self.clear_items()
         self.add_item(LinkPlayerActionSelect(self))
-        if self.actor.guild_permissions.administrator:
+        if _is_admin(self.actor):
             self.add_item(LinkPlayerTargetSelect(self))
         self.add_item(LinkPlayerDetailsButton(self))
         private_button = LinkPlayerConfirmPrivateButton(self)
@@ -9512,11 +9925,7 @@ class LinkPlayerModal(discord.ui.Modal):
     async def on_submit(self, interaction: discord.Interaction) -> None:
         member = self.parent_view.member
         guild = self.parent_view.guild
-        actor = (
-            interaction.user
-            if isinstance(interaction.user, discord.Member)
-            else guild.get_member(interaction.user.id)  # type: ignore[arg-type]
-        )
+        actor = _resolve_member(interaction)
 
         if actor is None:
             await interaction.response.send_message(
@@ -9525,7 +9934,7 @@ class LinkPlayerModal(discord.ui.Modal):
             )
             return
 
-        if actor.id != member.id and not actor.guild_permissions.administrator:
+        if actor.id != member.id and not _is_admin(actor):
             await interaction.response.send_message(
                 "⚠️ Only the member themselves or an administrator can manage linked tags from this view.",
                 ephemeral=True,
@@ -9608,7 +10017,7 @@ class LinkPlayerSelect(discord.ui.Select):
 
         member = self.parent_view.member
         actor = interaction.user
-        if actor.id != member.id and not actor.guild_permissions.administrator:
+        if actor.id != member.id and not _is_admin(actor):
             await interaction.response.send_message(
                 "⚠️ Only the member themselves or an administrator can manage linked tags from this view.",
                 ephemeral=True,
@@ -10349,7 +10758,7 @@ class RegisterMeView(discord.ui.View):
             return
 
         is_owner = interaction.user.id == self.member.id
-        if not is_owner and not interaction.user.guild_permissions.administrator:
+        if not is_owner and not _is_admin(interaction.user):
             await interaction.response.send_message(
                 "Only the member themselves or an administrator can manage these roles here.",
                 ephemeral=True,
@@ -10631,9 +11040,7 @@ class RoleSelect(discord.ui.Select):
         log.debug("RoleSelect.callback invoked")
         await interaction.response.defer(ephemeral=True, thinking=True)
         guild = self.parent_view.guild
-        member = interaction.user if isinstance(interaction.user, discord.Member) else None
-        if member is None:
-            member = guild.get_member(interaction.user.id)
+        member = _resolve_member(interaction)
         if member is None:
             await send_text_response(
                 interaction, "❌ Could not resolve your member object.", ephemeral=True
@@ -10701,14 +11108,10 @@ async def toggle_war_alerts(interaction: discord.Interaction, enable: bool):
     _record_command_usage(interaction, "toggle_war_alerts")
     log.debug("toggle_war_alerts invoked (enable=%s)", enable)
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command is only available inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
-    member = interaction.user if isinstance(interaction.user, discord.Member) else interaction.guild.get_member(interaction.user.id)
+    member = _resolve_member(interaction)
     if member is None:
         await send_text_response(
             interaction,
@@ -10717,7 +11120,7 @@ async def toggle_war_alerts(interaction: discord.Interaction, enable: bool):
         )
         return
 
-    role = discord.utils.get(interaction.guild.roles, name=ALERT_ROLE_NAME)
+    role = _get_alert_role(interaction.guild)
 
     if enable:
         if role is None:
@@ -10787,15 +11190,11 @@ async def assign_bases(interaction: discord.Interaction, clan_name: str):
     _record_command_usage(interaction, "assign_bases")
     log.debug("assign_bases invoked for clan %s", clan_name)
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command is only available inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     member = interaction.user
-    if not isinstance(member, discord.Member) or not member.guild_permissions.administrator:
+    if not _is_admin(member):
         await send_text_response(
             interaction,
             "❌ Only administrators can assign war targets.",
@@ -10806,11 +11205,7 @@ async def assign_bases(interaction: discord.Interaction, clan_name: str):
     clan_tags = _clan_names_for_guild(interaction.guild.id)
     tag = clan_tags.get(clan_name)
     if not tag:
-        await send_text_response(
-            interaction,
-            f"⚠️ `{clan_name}` is not configured for this server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "clan_not_configured", clan_name=clan_name)
         return
     try:
         war = await client.get_active_war_raw(tag)
@@ -10935,7 +11330,7 @@ async def build_war_roster(member, war, interaction):
     enemy_roster = _normalise_roster(list(getattr(war.opponent, "members", [])), "enemy")
     enemy_positions = sorted(enemy_roster.keys())
 
-    alert_role = discord.utils.get(interaction.guild.roles, name=ALERT_ROLE_NAME)
+    alert_role = _get_alert_role(interaction.guild)
     log.debug(
         "build_war_roster totals home=%d enemy=%d",
         len(home_roster),
@@ -10955,11 +11350,7 @@ async def assign_clan_role(interaction: discord.Interaction):
     _record_command_usage(interaction, "assign_clan_role")
     log.debug("assign_clan_role invoked")
     if interaction.guild is None:
-        await send_text_response(
-            interaction,
-            "❌ This command is only available inside a Discord server.",
-            ephemeral=True,
-        )
+        await _send_error(interaction, "no_guild")
         return
 
     clan_map = _clan_names_for_guild(interaction.guild.id)
@@ -4,7 +4,7 @@ import logging
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import os
 from dotenv import load_dotenv
 
@@ -79,13 +79,8 @@ def _prune_old_logs(retention_days: int = LOG_RETENTION_DAYS) -> None:
             log_file.unlink(missing_ok=True)
 
 
-def log_command_call(command_name: str, *, user_id: Optional[int] = None) -> None:
-    """Track how many times a slash command has been executed.
-
-    Parameters:
-        command_name (str, required): Canonical name of the command.
-        user_id (Optional[int], optional): Discord user identifier to aggregate anonymised usage statistics.
-    """
+def _count_command_call(command_name: str, user_id: Optional[int]) -> None:
+    """Update the in-memory usage counters for a single command invocation."""
     _command_counters[command_name] += 1
     metadata = _command_metadata.setdefault(
         command_name,
@@ -96,6 +91,16 @@ def log_command_call(command_name: str, *, user_id: Optional[int] = None) -> Non
     if user_id is not None:
         _user_counters[user_id] += 1
         _command_user_counters[command_name][user_id] += 1
+
+
+def log_command_call(command_name: str, *, user_id: Optional[int] = None) -> None:
+    """Track how many times a slash command has been executed.
+
+    Parameters:
+        command_name (str, required): Canonical name of the command.
+        user_id (Optional[int], optional): Discord user identifier to aggregate anonymised usage statistics.
+    """
+    _count_command_call(command_name, user_id)
     _logger.info(
         "Command %s invoked (%d total)",
         command_name,
@@ -103,6 +108,23 @@ def log_command_call(command_name: str, *, user_id: Optional[int] = None) -> Non
     )
 
 
+def log_command_calls(calls: Iterable[Tuple[str, Optional[int]]]) -> None:
+    """Track a batch of slash command executions with a single log record.
+
+    Parameters:
+        calls (Iterable[Tuple[str, Optional[int]]], required): ``(command_name, user_id)`` pairs to count.
+    """
+    invoked: List[str] = []
+    for command_name, user_id in calls:
+        _count_command_call(command_name, user_id)
+        invoked.append(command_name)
+    if invoked:
+        _logger.info(
+            "Commands invoked: %s",
+            ", ".join(f"{name} ({_command_counters[name]} total)" for name in dict.fromkeys(invoked)),
+        )
+
+
 def get_command_count(command_name: str) -> int:
     """Return the current invocation count for a command."""
     return _command_counters[command_name]
@@ -30,12 +30,14 @@ async def on_ready():
     try:
         from Discord_Commands import (
             ensure_report_schedule_loop_running,
+            ensure_usage_recorder_running,
             ensure_war_alert_loop_running,
         )
 
         log.debug("Starting background loops")
         ensure_war_alert_loop_running()
         ensure_report_schedule_loop_running()
+        ensure_usage_recorder_running()
     except Exception as exc:
         log.exception("Failed to start background loops")
         print(f"Failed to start background loops: {exc}")
@@ -47,3 +49,4 @@ if __name__ == "__main__":
     print("[DEBUG] Attempting to run bot")
     bot.run(Dkey)
     print("[DEBUG] Bot run started")
+    Discord_Commands.flush_pending_config_save()